@@ -1,8 +1,9 @@
-from typing import Dict, Any, List, Tuple, TypeVar, Optional
+from typing import Dict, Any, List, Tuple, TypeVar, Optional, ClassVar
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from langgraph.graph import StateGraph, END
-from pydantic import BaseModel, Field
-from langchain.schema import BaseMessage, HumanMessage, AIMessage
+from pydantic import BaseModel, Field, field_serializer
+from langchain.schema import BaseMessage, HumanMessage, AIMessage, messages_to_dict
 
 # Define a generic type for state
 StateType = TypeVar("StateType", bound=BaseModel)
@@ -19,6 +20,27 @@ class AgentState(BaseModel):
     status: str = Field(default="running")
     error: Optional[str] = Field(default=None)
 
+    @field_serializer("messages", when_used="json")
+    def serialize_messages(self, messages: List[BaseMessage]) -> List[Dict[str, Any]]:
+        """Dump messages with LangChain's own format, since pydantic can't dump them to JSON."""
+        return messages_to_dict(messages)
+
+    @classmethod
+    def construct_trusted(cls, **fields: Any) -> 'AgentState':
+        """
+        Build a state from trusted internal values, skipping validation.
+        Fields that are not given fall back to their defaults.
+        Values are neither validated nor copied, so the new state takes ownership of
+        any containers passed in; callers must not pass ones they keep using.
+        
+        Args:
+            **fields: Field values to set on the new state
+            
+        Returns:
+            AgentState: New state instance
+        """
+        return cls.model_construct(**fields)
+
     def merge(self, other: 'AgentState') -> Dict[str, Any]:
         """
         Merge base state fields.
@@ -36,13 +58,51 @@ class AgentState(BaseModel):
             "status": other.status,
             "error": other.error if other.error else self.error
         }
+    
+    def merge_inplace(self, other: 'AgentState') -> 'AgentState':
+        """
+        Merge base state fields from another state into this one.
+        Unlike merge, existing messages are extended in place rather than
+        copied, so repeatedly accumulating states stays linear. The context is
+        replaced by a merged copy instead, since it may be shared with the
+        caller that supplied it.
+        
+        Args:
+            other (AgentState): Another state to merge with
+            
+        Returns:
+            AgentState: This state, updated
+        """
+        self.messages.extend(other.messages)
+        if other.context:
+            self.context = {**self.context, **other.context}
+        self.next_step = other.next_step
+        self.status = other.status
+        if other.error:
+            self.error = other.error
+        return self
+
+# Agent running in the current task. Lets the state graph shared by all
+# instances of a class dispatch to the right agent without closing over it.
+_current_agent: ContextVar['BaseAgent'] = ContextVar("current_agent")
 
 class BaseAgent(ABC):
     """Base agent class for all specialized agents."""
     
+    # Compiled state graphs shared by all instances of the same agent class
+    _graph_cache: ClassVar[Dict[type, StateGraph]] = {}
+    
     def __init__(self, name: str):
         self.name = name
-        self.state_graph = self._create_state_graph()
+        self.state_graph = self._shared_state_graph()
+    
+    def _shared_state_graph(self) -> StateGraph:
+        """Get the state graph for this agent's class, building it on first use."""
+        cls = type(self)
+        cache = BaseAgent._graph_cache
+        if cls not in cache:
+            cache[cls] = self._create_state_graph()
+        return cache[cls]
     
     def add_message_to_state(self, state: AgentState, message: str, role: str = "human") -> AgentState:
         """Add a message to the state's message history."""
@@ -54,7 +114,12 @@ class BaseAgent(ABC):
     
     @abstractmethod
     def _create_state_graph(self) -> StateGraph:
-        """Create the state graph for this agent using LangGraph."""
+        """
+        Create the state graph for this agent using LangGraph.
+        The graph is built once per class and shared by all instances, so it
+        must not capture instance state; nodes can reach the running agent
+        through _current_agent.
+        """
         pass
     
     @abstractmethod
@@ -71,10 +136,10 @@ class BaseAgent(ABC):
         # Initialize the graph with our state type
         workflow = StateGraph(AgentState)
         
-        # Define the process node
+        # Define the process node, dispatching to the agent running in this task
         async def process_node(state: AgentState) -> Tuple[AgentState, str]:
             try:
-                return await self.process(state)
+                return await _current_agent.get().process(state)
             except Exception as e:
                 state.status = "error"
                 state.error = str(e)
@@ -97,10 +162,12 @@ class BaseAgent(ABC):
     async def execute(self, initial_input: str = None, context: Dict[str, Any] = None) -> AgentState:
         """Execute the agent's workflow."""
         # Initialize state
-        state = AgentState(
+        # The same context may be passed to several concurrent agents, so each
+        # state gets its own copy
+        state = AgentState.construct_trusted(
             messages=[],
             next_step="start",
-            context=context or {},
+            context=dict(context) if context else {},
             status="running"
         )
         
@@ -109,10 +176,13 @@ class BaseAgent(ABC):
             state = self.add_message_to_state(state, initial_input)
         
         # Execute the workflow
+        token = _current_agent.set(self)
         try:
             result = await self.state_graph.arun(state)
             return result
         except Exception as e:
             state.status = "error"
             state.error = str(e)
-            return state
\ No newline at end of file
+            return state
+        finally:
+            _current_agent.reset(token)
\ No newline at end of file
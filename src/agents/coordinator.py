@@ -1,5 +1,7 @@
-from typing import Dict, List, Set, Optional, Any
+from typing import FrozenSet, Mapping, Tuple, Optional
+from types import MappingProxyType
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 from .base_agent import AgentState
 
@@ -19,112 +21,125 @@ class ExecutionStatus(str, Enum):
     SKIPPED = "skipped"
     FALLBACK = "fallback"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentGroup:
     """Group of agents that can be executed concurrently."""
-    agents: Set[str]  # Agent types in this group
+    agents: FrozenSet[str]  # Agent types in this group
     priority: ExecutionPriority
-    dependencies: Set[str] = None  # Agent groups that must complete first
+    dependencies: FrozenSet[str] = frozenset()  # Agent groups that must complete first
     fallback_group: Optional[str] = None  # Fallback group if this fails
+    
+    def __post_init__(self):
+        # Accept any iterable of names but always store hashable frozensets
+        object.__setattr__(self, "agents", frozenset(self.agents))
+        object.__setattr__(self, "dependencies", frozenset(self.dependencies or ()))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CoordinationPlan:
-    """Complete plan for agent coordination."""
-    groups: Dict[str, AgentGroup]  # Group ID -> Group
-    execution_order: List[Set[str]]  # Sets of group IDs that can run concurrently
-    fallback_chain: List[str]  # Chain of fallback groups to try
+    """
+    Complete plan for agent coordination, as used by the executor.
+    The LLM-facing, serializable counterpart lives in models.coordination.
+    """
+    groups: Mapping[str, AgentGroup]  # Group ID -> Group, read-only
+    execution_order: Tuple[FrozenSet[str], ...]  # Sets of group IDs that can run concurrently
+    fallback_chain: Tuple[str, ...]  # Chain of fallback groups to try
     
+    def __post_init__(self):
+        object.__setattr__(self, "groups", MappingProxyType(dict(self.groups)))
+        object.__setattr__(self, "execution_order", tuple(frozenset(s) for s in self.execution_order))
+        object.__setattr__(self, "fallback_chain", tuple(self.fallback_chain))
+
+# Plans are constant, so they are built once at import time and shared.
+# Groups are read-only mappings, sets are frozen and sequences are tuples so the
+# shared plans cannot be mutated.
+_DEFAULT_PLAN = CoordinationPlan(
+    groups={
+        "primary": AgentGroup(
+            agents=frozenset({"learning_path"}),
+            priority=ExecutionPriority.HIGH,
+            fallback_group="fallback"
+        ),
+        "secondary": AgentGroup(
+            agents=frozenset({"content_processor"}),
+            priority=ExecutionPriority.MEDIUM,
+            dependencies=frozenset({"primary"})
+        ),
+        "fallback": AgentGroup(
+            agents=frozenset({"basic_agent"}),
+            priority=ExecutionPriority.FALLBACK
+        )
+    },
+    execution_order=(frozenset({"primary"}), frozenset({"secondary"})),
+    fallback_chain=("fallback",)
+)
+
+_FALLBACK_PLAN = CoordinationPlan(
+    groups={
+        "emergency": AgentGroup(
+            agents=frozenset({"basic_agent"}),
+            priority=ExecutionPriority.FALLBACK
+        )
+    },
+    execution_order=(frozenset({"emergency"}),),
+    fallback_chain=()
+)
+
 class CoordinationAnalyzer:
     """Analyzes coordination requirements and creates execution plans."""
     
     @staticmethod
     def extract_coordination_from_state(state: AgentState) -> Optional[CoordinationPlan]:
         """Extract coordination plan from coordinator agent state."""
-        try:
-            if not state.messages:
-                return None
-                
-            # Get the latest message
-            latest_message = state.messages[-1].content
-            
-            # TODO: Implement actual coordination analysis
-            # For now, return a basic plan
-            return CoordinationAnalyzer.create_default_plan()
-            
-        except Exception as e:
-            # Log error and return default plan
-            print(f"Error extracting coordination plan: {e}")
-            return CoordinationAnalyzer.create_fallback_plan()
+        if not state.messages:
+            return None
+        
+        # TODO: Implement actual coordination analysis of the latest message.
+        # Until then every non-empty conversation maps to the shared default
+        # plan, so the message content is not read at all.
+        return _DEFAULT_PLAN
     
     @staticmethod
     def create_default_plan() -> CoordinationPlan:
-        """Create a default coordination plan."""
-        groups = {
-            "primary": AgentGroup(
-                agents={"learning_path"},
-                priority=ExecutionPriority.HIGH,
-                fallback_group="fallback"
-            ),
-            "secondary": AgentGroup(
-                agents={"content_processor"},
-                priority=ExecutionPriority.MEDIUM,
-                dependencies={"primary"}
-            ),
-            "fallback": AgentGroup(
-                agents={"basic_agent"},
-                priority=ExecutionPriority.FALLBACK
-            )
-        }
-        
-        execution_order = [{"primary"}, {"secondary"}]
-        fallback_chain = ["fallback"]
-        
-        return CoordinationPlan(
-            groups=groups,
-            execution_order=execution_order,
-            fallback_chain=fallback_chain
-        )
+        """Create a default coordination plan (shared instance, do not mutate)."""
+        return _DEFAULT_PLAN
     
     @staticmethod
     def create_fallback_plan() -> CoordinationPlan:
-        """Create an emergency fallback plan."""
-        groups = {
-            "emergency": AgentGroup(
-                agents={"basic_agent"},
-                priority=ExecutionPriority.FALLBACK
-            )
-        }
-        
-        return CoordinationPlan(
-            groups=groups,
-            execution_order=[{"emergency"}],
-            fallback_chain=[]
-        )
+        """Create an emergency fallback plan (shared instance, do not mutate)."""
+        return _FALLBACK_PLAN
     
     @staticmethod
     def validate_plan(plan: CoordinationPlan) -> bool:
         """Validate a coordination plan for consistency."""
         try:
-            # Check all groups exist
-            all_groups = set(plan.groups.keys())
-            
-            # Check execution order references valid groups
-            for group_set in plan.execution_order:
-                if not group_set.issubset(all_groups):
-                    return False
-            
-            # Check dependencies exist
-            for group in plan.groups.values():
-                if group.dependencies and not group.dependencies.issubset(all_groups):
-                    return False
-                if group.fallback_group and group.fallback_group not in all_groups:
-                    return False
-            
-            # Check fallback chain references valid groups
-            if not set(plan.fallback_chain).issubset(all_groups):
-                return False
-            
-            return True
+            # Reduce the plan to a hashable key so repeated validations hit the cache
+            groups_key = frozenset(
+                (group_id, group.dependencies, group.fallback_group)
+                for group_id, group in plan.groups.items()
+            )
+            return _validate_plan_key(groups_key, plan.execution_order, plan.fallback_chain)
             
         except Exception:
-            return False 
\ No newline at end of file
+            return False
+
+@lru_cache(maxsize=128)
+def _validate_plan_key(
+    groups_key: FrozenSet[Tuple[str, FrozenSet[str], Optional[str]]],
+    execution_order: Tuple[FrozenSet[str], ...],
+    fallback_chain: Tuple[str, ...]
+) -> bool:
+    """Check a plan key in a single pass, stopping at the first invalid reference."""
+    all_groups = {group_id for group_id, _, _ in groups_key}
+    
+    # Check dependencies and fallbacks exist
+    for _, dependencies, fallback_group in groups_key:
+        if not dependencies.issubset(all_groups):
+            return False
+        if fallback_group and fallback_group not in all_groups:
+            return False
+    
+    # Check execution order and fallback chain reference valid groups
+    for group_set in execution_order:
+        if not group_set.issubset(all_groups):
+            return False
+    return all_groups.issuperset(fallback_chain)
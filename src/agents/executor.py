@@ -1,22 +1,42 @@
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, AsyncIterator
 from enum import Enum
 import asyncio
+import itertools
 from dataclasses import dataclass
 import logging
 from .base_agent import BaseAgent, AgentState
 from .factory import AgentFactory
 from .coordinator import (
-    ExecutionStrategy, ExecutionStatus, ExecutionPriority,
+    ExecutionStatus, ExecutionPriority,
     AgentGroup, CoordinationPlan, CoordinationAnalyzer
 )
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Default cap on concurrently running agents per executor
+DEFAULT_MAX_CONCURRENCY = 32
+
+# Process-wide sequence for unique execution ids
+_execution_seq = itertools.count()
+
+@dataclass(frozen=True, slots=True)
 class ExecutionResult:
     """Holds the result of an agent execution."""
     agent_type: str
     state: AgentState
     status: ExecutionStatus
     error: Optional[Exception] = None
+    
+    @property
+    def success(self) -> bool:
+        """Whether the execution completed."""
+        return self.status is ExecutionStatus.COMPLETED
+
+def _any_completed(results: List[ExecutionResult]) -> bool:
+    """Check whether any execution result completed successfully."""
+    completed = ExecutionStatus.COMPLETED
+    # statuses are enum singletons, so identity is enough
+    return any(r.status is completed for r in results)
 
 class AgentExecutor:
     """
@@ -27,11 +47,64 @@ class AgentExecutor:
     - Agent chaining
     """
     
-    def __init__(self, factory: AgentFactory):
+    def __init__(self, factory: AgentFactory, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
         self.factory = factory
         self._active_agents: Dict[str, BaseAgent] = {}
         self._execution_tasks: Dict[str, asyncio.Task] = {}
-        self.logger = logging.getLogger(__name__)
+        # Admission control capping how many agents run at once so large fan-outs
+        # don't flood the loop; the cap can be changed at runtime
+        self._admission = asyncio.Condition()
+        self._running = 0
+        self._max_concurrency = max_concurrency
+        self.logger = logger
+    
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of agents run at once by group and parallel execution."""
+        return self._max_concurrency
+    
+    async def set_max_concurrency(self, max_concurrency: int) -> None:
+        """Change the concurrency cap, admitting waiting executions if it was raised."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        async with self._admission:
+            self._max_concurrency = max_concurrency
+            self._admission.notify_all()
+    
+    async def _execute_bounded(
+        self,
+        agent_type: str,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> ExecutionResult:
+        """Execute a single agent once a concurrency slot is free."""
+        async with self._admission:
+            try:
+                await self._admission.wait_for(lambda: self._running < self._max_concurrency)
+            except asyncio.CancelledError:
+                # A waiter cancelled after being notified swallows the wake-up, so pass it on
+                if self._running < self._max_concurrency:
+                    self._admission.notify(1)
+                raise
+            self._running += 1
+        try:
+            return await self.execute_agent(
+                agent_type=agent_type,
+                query=query,
+                context=context,
+                timeout=timeout
+            )
+        finally:
+            # Free the slot before taking the lock so a cancelled release can't leak it,
+            # and shield the wake-up so a cancelled release can't drop it either
+            self._running -= 1
+            await asyncio.shield(self._wake_waiter())
+    
+    async def _wake_waiter(self) -> None:
+        """Wake one execution waiting for a concurrency slot."""
+        async with self._admission:
+            self._admission.notify(1)
         
     async def execute_agent(
         self,
@@ -41,16 +114,19 @@ class AgentExecutor:
         timeout: Optional[float] = None
     ) -> ExecutionResult:
         """Execute a single agent with timeout and error handling."""
+        execution_id = None
         # Get or create agent instance
         try:
             agent = self.factory.create(agent_type, context)
-            self._active_agents[agent.name] = agent
+            # Track each execution under its own id rather than the agent name it happens to use
+            execution_id = f"{agent.name}:{next(_execution_seq)}"
+            self._active_agents[execution_id] = agent
             
             # Create execution task
             task = asyncio.create_task(
                 agent.execute(initial_input=query, context=context)
             )
-            self._execution_tasks[agent.name] = task
+            self._execution_tasks[execution_id] = task
             
             # Wait for completion or timeout
             state = await asyncio.wait_for(
@@ -64,26 +140,92 @@ class AgentExecutor:
             )
             
         except asyncio.TimeoutError:
-            self.logger.warning(f"Agent {agent_type} execution timed out")
+            self.logger.warning("Agent %s execution timed out", agent_type)
             return ExecutionResult(
                 agent_type=agent_type,
-                state=AgentState(status="timeout"),
+                state=AgentState.construct_trusted(status="timeout"),
                 status=ExecutionStatus.FAILED,
                 error=TimeoutError(f"Agent {agent_type} execution timed out")
             )
             
         except Exception as e:
-            self.logger.error(f"Agent {agent_type} execution failed: {e}")
+            self.logger.error("Agent %s execution failed: %s", agent_type, e)
             return ExecutionResult(
                 agent_type=agent_type,
-                state=AgentState(status="error", error=str(e)),
+                state=AgentState.construct_trusted(status="error", error=str(e)),
                 status=ExecutionStatus.FAILED,
-                error=e
+                # The traceback references this frame, which references the error,
+                # its context and the agent; drop it so results are freed by refcount
+                error=e.with_traceback(None)
             )
             
         finally:
             # Cleanup
-            await self.stop_agent(agent.name if 'agent' in locals() else None)
+            await self.stop_agent(execution_id)
+    
+    async def execute_parallel(
+        self,
+        agent_types: List[str],
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> List[ExecutionResult]:
+        """
+        Execute agents concurrently on the same input, returning results in input order.
+        At most max_concurrency agents run at once; the rest wait for a free slot.
+        """
+        # execute_agent turns failures into results, so the group only cancels on
+        # cancellation, and then waits for every execution to unwind before exiting
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(self._execute_bounded(agent_type, query, context, timeout))
+                for agent_type in agent_types
+            ]
+        return [task.result() for task in tasks]
+    
+    async def iter_chain(
+        self,
+        agent_chain: List[str],
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[ExecutionResult]:
+        """
+        Execute a chain of agents in sequence, yielding each result as soon as it is ready.
+        Each agent sees the previous agent and its final response in the shared context.
+        The chain stops after the first failed agent.
+        """
+        context = context if context is not None else {}
+        for agent_type in agent_chain:
+            result = await self.execute_agent(
+                agent_type=agent_type,
+                query=query,
+                context=context,
+                timeout=timeout
+            )
+            yield result
+            if result.status is not ExecutionStatus.COMPLETED:
+                return
+            
+            messages = result.state.messages
+            context["previous_agent"] = agent_type
+            context["previous_result"] = messages[-1].content if messages else None
+    
+    async def execute_chain(
+        self,
+        agent_chain: List[str],
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        parallel: bool = False
+    ) -> List[ExecutionResult]:
+        """
+        Execute a chain of agents and collect all results.
+        With parallel=True the agents run concurrently on the same input instead.
+        """
+        if parallel:
+            return await self.execute_parallel(agent_chain, query, context, timeout)
+        return [result async for result in self.iter_chain(agent_chain, query, context, timeout)]
     
     async def execute_group(
         self,
@@ -93,23 +235,23 @@ class AgentExecutor:
         timeout: Optional[float] = None
     ) -> List[ExecutionResult]:
         """Execute a group of agents concurrently."""
-        tasks = []
-        results = []
-        
-        for agent_type in group.agents:
-            task = asyncio.create_task(
-                self.execute_agent(
+        tasks = [
+            (agent_type, asyncio.create_task(
+                self._execute_bounded(
                     agent_type=agent_type,
                     query=query,
                     context=context,
                     timeout=timeout
                 )
-            )
-            tasks.append((agent_type, task))
+            ))
+            for agent_type in group.agents
+        ]
+        if not tasks:
+            return []
         
         try:
             if timeout:
-                done, pending = await asyncio.wait(
+                _, pending = await asyncio.wait(
                     [task for _, task in tasks],
                     timeout=timeout,
                     return_when=asyncio.ALL_COMPLETED
@@ -118,38 +260,41 @@ class AgentExecutor:
                 for task in pending:
                     task.cancel()
             else:
-                done = await asyncio.gather(*[task for _, task in tasks])
-            
-            # Collect results
-            for agent_type, task in tasks:
-                try:
-                    if task.done():
-                        result = await task
-                        results.append(result)
-                    else:
-                        results.append(ExecutionResult(
-                            agent_type=agent_type,
-                            state=AgentState(status="timeout"),
-                            status=ExecutionStatus.FAILED,
-                            error=TimeoutError("Execution timed out")
-                        ))
-                except Exception as e:
-                    self.logger.error(f"Error collecting result for {agent_type}: {e}")
-                    results.append(ExecutionResult(
-                        agent_type=agent_type,
-                        state=AgentState(status="error", error=str(e)),
-                        status=ExecutionStatus.FAILED,
-                        error=e
-                    ))
-            
-            return results
-            
+                # Exceptions are collected per task below rather than raised here
+                await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+                pending = set()
         except Exception as e:
-            self.logger.error(f"Group execution failed: {e}")
+            self.logger.error("Group execution failed: %s", e)
             # Cancel all tasks on error
             for _, task in tasks:
                 task.cancel()
             raise e
+        
+        # Collect results straight from the finished tasks
+        results = []
+        for agent_type, task in tasks:
+            if task in pending or task.cancelled():
+                results.append(ExecutionResult(
+                    agent_type=agent_type,
+                    state=AgentState.construct_trusted(status="timeout"),
+                    status=ExecutionStatus.FAILED,
+                    error=TimeoutError("Execution timed out")
+                ))
+                continue
+            
+            error = task.exception()
+            if error is None:
+                results.append(task.result())
+            else:
+                self.logger.error("Error collecting result for %s: %s", agent_type, error)
+                results.append(ExecutionResult(
+                    agent_type=agent_type,
+                    state=AgentState.construct_trusted(status="error", error=str(error)),
+                    status=ExecutionStatus.FAILED,
+                    error=error.with_traceback(None)
+                ))
+        
+        return results
     
     async def execute_coordination_plan(
         self,
@@ -167,6 +312,8 @@ class AgentExecutor:
         
         results: Dict[str, List[ExecutionResult]] = {}
         completed_groups: Set[str] = set()
+        # Tracks whether any group (or group fallback) produced a completed result
+        any_completed = False
         
         # Execute groups in order
         for concurrent_groups in plan.execution_order:
@@ -176,7 +323,7 @@ class AgentExecutor:
             for group_id in concurrent_groups:
                 group = plan.groups[group_id]
                 if group.dependencies and not group.dependencies.issubset(completed_groups):
-                    self.logger.warning(f"Skipping group {group_id} due to missing dependencies")
+                    self.logger.warning("Skipping group %s due to missing dependencies", group_id)
                     results[group_id] = []
                     continue
                 
@@ -193,12 +340,13 @@ class AgentExecutor:
                     results[group_id] = group_results
                     
                     # Check if group succeeded
-                    if any(r.status == ExecutionStatus.COMPLETED for r in group_results):
+                    fallback_id = plan.groups[group_id].fallback_group
+                    if _any_completed(group_results):
                         completed_groups.add(group_id)
-                    elif plan.groups[group_id].fallback_group:
+                        any_completed = True
+                    elif fallback_id:
                         # Try fallback
-                        fallback_id = plan.groups[group_id].fallback_group
-                        self.logger.info(f"Trying fallback {fallback_id} for failed group {group_id}")
+                        self.logger.info("Trying fallback %s for failed group %s", fallback_id, group_id)
                         fallback_results = await self.execute_group(
                             plan.groups[fallback_id],
                             query,
@@ -206,14 +354,15 @@ class AgentExecutor:
                             timeout
                         )
                         results[fallback_id] = fallback_results
+                        if _any_completed(fallback_results):
+                            any_completed = True
                         
                 except Exception as e:
-                    self.logger.error(f"Error executing group {group_id}: {e}")
+                    self.logger.error("Error executing group %s: %s", group_id, e)
                     results[group_id] = []
         
         # If no successful results, try fallback chain
-        if not any(any(r.status == ExecutionStatus.COMPLETED for r in group_results)
-                  for group_results in results.values()):
+        if not any_completed:
             for fallback_id in plan.fallback_chain:
                 try:
                     fallback_results = await self.execute_group(
@@ -223,10 +372,10 @@ class AgentExecutor:
                         timeout
                     )
                     results[fallback_id] = fallback_results
-                    if any(r.status == ExecutionStatus.COMPLETED for r in fallback_results):
+                    if _any_completed(fallback_results):
                         break
                 except Exception as e:
-                    self.logger.error(f"Fallback {fallback_id} failed: {e}")
+                    self.logger.error("Fallback %s failed: %s", fallback_id, e)
         
         return results
     
@@ -252,30 +401,33 @@ class AgentExecutor:
             return await self.execute_coordination_plan(plan, query, context, timeout)
             
         except Exception as e:
-            self.logger.error(f"Coordination execution failed: {e}")
+            self.logger.error("Coordination execution failed: %s", e)
             # Emergency fallback
             plan = CoordinationAnalyzer.create_fallback_plan()
             return await self.execute_coordination_plan(plan, query, context, timeout)
     
-    async def stop_agent(self, agent_name: str) -> None:
-        """Stop a specific agent execution."""
+    async def stop_agent(self, agent_name: Optional[str]) -> None:
+        """Stop a specific agent execution, identified by its execution id."""
         if agent_name and agent_name in self._execution_tasks:
             task = self._execution_tasks[agent_name]
-            task.cancel()
             try:
-                await task
-            except asyncio.CancelledError:
-                pass
+                # A finished task's outcome was already reported by its execution;
+                # awaiting it again here would re-raise the agent's error
+                if not task.done():
+                    task.cancel()
+                    # Errors raised while unwinding are irrelevant once the agent is stopped
+                    await asyncio.gather(task, return_exceptions=True)
             finally:
                 self._execution_tasks.pop(agent_name, None)
                 self._active_agents.pop(agent_name, None)
     
     async def stop_all(self) -> None:
-        """Stop all active agents."""
-        tasks = []
-        for agent_name in list(self._execution_tasks.keys()):
-            tasks.append(self.stop_agent(agent_name))
+        """Stop all active agents, waiting for every cancelled execution to finish unwinding."""
+        tasks = list(self._execution_tasks.values())
+        for task in tasks:
+            task.cancel()
         if tasks:
-            await asyncio.gather(*tasks)
+            # Errors raised while unwinding are irrelevant once the agents are stopped
+            await asyncio.gather(*tasks, return_exceptions=True)
         self._execution_tasks.clear()
         self._active_agents.clear()
\ No newline at end of file
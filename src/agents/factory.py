@@ -1,8 +1,12 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Type
+import itertools
 from .registry import AgentRegistry
 from .base_agent import BaseAgent
 from src.config import AppConfig
 
+# Process-wide sequence for unique agent names
+_agent_seq = itertools.count()
+
 class AgentFactory:
     """
     Factory for creating agent instances.
@@ -18,6 +22,22 @@ class AgentFactory:
         self.registry = registry
         self.config = config
         self.dependencies = dependencies or {}
+        # agent class lookups, valid for as long as the registry version is unchanged
+        self._class_cache: Dict[str, Type[BaseAgent]] = {}
+        self._class_cache_version = registry.version
+    
+    def _class_for(self, agent_type: str) -> Optional[Type[BaseAgent]]:
+        """Get the agent class for a type, caching lookups until the registry changes."""
+        if self._class_cache_version != self.registry.version:
+            self._class_cache.clear()
+            self._class_cache_version = self.registry.version
+        
+        agent_class = self._class_cache.get(agent_type)
+        if agent_class is None:
+            agent_class = self.registry.get_agent_class(agent_type)
+            if agent_class is not None:
+                self._class_cache[agent_type] = agent_class
+        return agent_class
         
     def create(
         self,
@@ -38,21 +58,25 @@ class AgentFactory:
             ValueError: If agent type is not registered
         """
         # Get agent class from registry
-        agent_class = self.registry.get_agent_class(agent_type)
+        agent_class = self._class_for(agent_type)
         if not agent_class:
             raise ValueError(f"Unknown agent type: {agent_type}")
         
-        # Create agent instance with name
-        agent_name = f"{agent_type}_{id(context)}"
+        # Create agent instance with a unique name; id(context) is reused
+        # once a context is garbage collected, so it cannot identify agents
+        agent_name = f"{agent_type}_{next(_agent_seq)}"
         agent = agent_class(name=agent_name)
         
         # Inject dependencies if agent needs them
-        if hasattr(agent, 'set_dependencies'):
-            agent.set_dependencies(self.dependencies)
+        set_dependencies = getattr(agent, 'set_dependencies', None)
+        if set_dependencies is not None:
+            set_dependencies(self.dependencies)
         
         # Set any additional context
-        if context and hasattr(agent, 'set_context'):
-            agent.set_context(context)
+        if context:
+            set_context = getattr(agent, 'set_context', None)
+            if set_context is not None:
+                set_context(context)
         
         return agent
     
@@ -48,6 +48,18 @@ class ValidationResult(BaseModel):
     warnings: List[str] = Field(default_factory=list)
     suggestions: List[str] = Field(default_factory=list)
 
+    def merge(self, other: 'ValidationResult') -> 'ValidationResult':
+        """
+        Merge another validation result into this one.
+        Every field is always set, so the other (later) result's values win;
+        its lists are copied so the merged result owns them.
+        """
+        return other.model_copy(update={
+            "errors": list(other.errors),
+            "warnings": list(other.warnings),
+            "suggestions": list(other.suggestions)
+        })
+
 class AgentGroupConfig(BaseModel):
     """Configuration for a group of agents."""
     agents: List[str]
@@ -67,7 +79,11 @@ class CoordinationState(BaseModel):
     results: Dict[str, Any] = Field(default_factory=dict)
 
 class CoordinationPlan(BaseModel):
-    """Complete coordination plan with LLM reasoning."""
+    """
+    Complete coordination plan with LLM reasoning.
+    Serialized form exchanged with the LLM; the executor runs the
+    immutable dataclass plan defined in agents.coordinator.
+    """
     groups: Dict[str, AgentGroupConfig]
     execution_order: List[Set[str]]
     fallback_chain: List[str]
@@ -1,8 +1,74 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import asyncio
-from typing import List, Dict
+import bisect
+import time
+from enum import IntEnum
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple, Optional
 from src.utils.academic_states import AcademicState, CalendarEvent, AcademicTask
 
+# reference points for converting event start times to epoch nanoseconds
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _epoch_ns(dt: datetime) -> int:
+    """
+    convert a datetime to integer nanoseconds since the unix epoch, comparable with time.time_ns().
+    naive datetimes are taken to be in local time.
+
+    Args:
+        dt (datetime): the datetime to convert.
+
+    Returns:
+        int: nanoseconds since the epoch.
+    """
+    return (dt.astimezone(timezone.utc) - _EPOCH) // _MICROSECOND * 1000
+
+def _event_start_ns(event: CalendarEvent) -> int:
+    """
+    get the start time of an event in epoch nanoseconds, parsing ISO string start times.
+
+    Args:
+        event (CalendarEvent): the calendar event.
+
+    Returns:
+        int: nanoseconds since the epoch at which the event starts.
+    """
+    start = event["start_time"]
+    if not isinstance(start, datetime):
+        start = datetime.fromisoformat(start)
+    return _epoch_ns(start)
+
+# shared read-only default for missing profile sections
+_EMPTY_DICT = MappingProxyType({})
+
+def _profile_signals(profile: Dict[str, Any]) -> Tuple[Any, Any, List[str]]:
+    """
+    read everything the profile checks need from a profile in one pass.
+
+    Args:
+        profile (Dict[str, Any]): the student profile.
+
+    Returns:
+        Tuple[Any, Any, List[str]]: learning style, learning patterns and current topics.
+    """
+    preferences = profile.get("preferences") or _EMPTY_DICT
+    return (
+        preferences.get("learning_style", _EMPTY_DICT),
+        preferences.get("patterns", _EMPTY_DICT),
+        profile.get("topics", [])
+    )
+
+class Tool(IntEnum):
+    """
+    integer ids for the react agent's tools, in the order of ReActAgent.tool_table.
+    lets the planner dispatch by index instead of hashing tool names.
+    """
+    SEARCH_CALENDAR = 0
+    ANALYZE_TASKS = 1
+    CHECK_LEARNING_STYLE = 2
+    CHECK_PERFORMANCE = 3
+
 class ReActAgent:
     """
     base class for all ReACT-based agents.
@@ -16,6 +82,14 @@ class ReActAgent:
     - action execution and feedback
     """
 
+    # tool method names, in Tool id order
+    _TOOL_NAMES = (
+        "search_calendar",                                                       # calendar search functionality
+        "analyze_tasks",                                                         # task analysis functionality
+        "check_learning_style",                                                  # learning style analysis
+        "check_performance"                                                      # academic performance checking
+    )
+
     def __init__(self, llm):
         """
         initialize the react agent with a language model and the available tools.
@@ -26,30 +100,112 @@ class ReActAgent:
         self.llm = llm
         # storing few-shot examples to guide the agent
         self.examples = []
-        # storing tools for specific actions the agent can take in a dictionary
-        self.tools = {
-            "search_calendar": self.search_calendar,                            # calendar search functionality
-            "analyze_tasks": self.analyze_tasks,                                # task analysis functionality
-            "check_learning_style": self.check_learning_style,                  # learning style analysis
-            "check_performance": self.check_performance                         # academic performance checking
-        }
+        # tools for specific actions the agent can take, indexed by Tool id for dispatch without name lookups
+        self.tool_table = tuple(getattr(self, name) for name in self._TOOL_NAMES)
+        # the same bound methods by name, built once and read-only
+        self.tools = MappingProxyType(dict(zip(self._TOOL_NAMES, self.tool_table)))
+        # start-time sorted index of the last calendar searched: (key, epoch ns starts, events)
+        self._calendar_index: Optional[Tuple[tuple, List[int], List[CalendarEvent]]] = None
+
+    def _sorted_calendar(self, calendar: Dict[str, CalendarEvent]) -> Tuple[List[int], List[CalendarEvent]]:
+        """
+        get the events of a calendar sorted by start time, with their start times in epoch nanoseconds.
+        the index is keyed on every event's identity and raw start time, so it is rebuilt whenever an
+        event is added, removed, replaced or rescheduled, including edits made in place.
+
+        Args:
+            calendar (Dict[str, CalendarEvent]): the calendar to index.
+
+        Returns:
+            Tuple[List[int], List[CalendarEvent]]: sorted start times and the matching events.
+        """
+        # comparing the key is a linear scan, far cheaper than parsing and sorting again.
+        # ids cannot be reused while the cached index still holds the old events
+        key = tuple((id(event), event["start_time"]) for event in calendar.values())
+        cached = self._calendar_index
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        # start times are parsed only here, when the index is rebuilt
+        entries = sorted(
+            ((_event_start_ns(event), index, event) for index, event in enumerate(calendar.values())),
+            key=lambda entry: entry[:2]
+        )
+        starts = [start for start, _, _ in entries]
+        events = [event for _, _, event in entries]
+        self._calendar_index = (key, starts, events)
+        return starts, events
 
-    async def search_calendar(self, state: AcademicState) -> List[CalendarEvent]:
+    async def run_tool(self, tool: Tool, state: AcademicState, **kwargs: Any) -> Any:
+        """
+        run a single tool selected by its Tool id.
+
+        Args:
+            tool (Tool): id of the tool to run.
+            state (AcademicState): the current academic state.
+
+        Returns:
+            Any: the tool result.
+        """
+        return await self.tool_table[tool](state, **kwargs)
+
+    async def run_tools(
+        self,
+        actions: List[Tuple[str, Dict[str, Any]]],
+        state: AcademicState,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        run several independent tool actions concurrently.
+        the tools only read state or write their own key in state.results,
+        so running them together on one state is safe.
+
+        Args:
+            actions (List[Tuple[str, Dict[str, Any]]]): (tool name, keyword arguments) pairs selected by the planner.
+            state (AcademicState): the current academic state passed to every tool.
+            return_exceptions (bool): if True, a failing tool's exception is returned in its slot instead of raised.
+
+        Returns:
+            List[Any]: tool results in the same order as the actions.
+
+        Raises:
+            ValueError: if an action names an unknown tool.
+        """
+        # resolve every tool before starting any, so an unknown name leaves no coroutine un-awaited
+        tools = []
+        for name, kwargs in actions:
+            tool = self.tools.get(name)
+            if tool is None:
+                raise ValueError(f"Unknown tool: {name}")
+            tools.append((tool, kwargs))
+        # total latency is bounded by the slowest tool instead of the sum of all tools
+        return await asyncio.gather(
+            *(tool(state, **kwargs) for tool, kwargs in tools),
+            return_exceptions=return_exceptions
+        )
+
+    async def search_calendar(self, state: AcademicState, limit: Optional[int] = None) -> List[CalendarEvent]:
         """
         search for upcoming calendar events
 
         Args:
             state (AcademicState): the current academic state of the agent.
+            limit (Optional[int]): if given, return only the next `limit` events.
         
         Returns:
-            List[CalendarEvent]: A list of upcoming calendar events.
-        """
-        # get events from calendar
-        events = list(state.calendar.values())
-        # get current time in UTC
-        current_time = datetime.now(timezone.utc)
-        # filter and return only future events
-        return [event for event in events if event["start_time"] > current_time]
+            List[CalendarEvent]: A list of upcoming calendar events, soonest first.
+
+        Raises:
+            ValueError: if limit is negative.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+        starts, events = self._sorted_calendar(state.calendar)
+        # skip past events with a binary search over integer start times instead of comparing every event
+        first_upcoming = bisect.bisect_right(starts, time.time_ns())
+        if limit is not None:
+            return events[first_upcoming:first_upcoming + limit]
+        return events[first_upcoming:]
     
     async def analyze_tasks(self, state: AcademicState) -> List[AcademicTask]:
         """
@@ -74,15 +230,12 @@ class ReActAgent:
         Returns:
             AcademicState: updated state with learning style analysis
         """
-        # Get learning preferences from profile
-        preferences = state.profile.get("preferences", {})
-        learning_data = {
-            "learning_style": preferences.get("learning_style", {}),
-            "patterns": preferences.get("patterns", {})
-        }
-
+        learning_style, patterns, _ = _profile_signals(state.profile)
         # update results in state
-        state.results["learning_style"] = learning_data
+        state.results["learning_style"] = {
+            "learning_style": learning_style,
+            "patterns": patterns
+        }
         return state
     
     async def check_performance(self, state: AcademicState) -> AcademicState:
@@ -96,15 +249,130 @@ class ReActAgent:
         Returns:
             AcademicState: updated state with performance analysis
         """
-        # get user's profile from state
-        profile = state.profile
-
         # get information on the topics the user is currently studying
-        topics = profile.get("topics", [])
+        _, _, topics = _profile_signals(state.profile)
 
         # add the results in state
-        if "results" not in state:
-            state["results"] = {}
-        state["results"]["performance_analysis"] = {"topics": topics}
+        state.results["performance_analysis"] = {"topics": topics}
 
         return state
+
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    """
+    answer a batched call with its result, or its exception if it failed.
+
+    Args:
+        future (asyncio.Future): the caller's future.
+        result (Any): the tool result or the exception it raised.
+    """
+    # the caller may have given up waiting
+    if future.done():
+        return
+    if isinstance(result, BaseException):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
+
+class ToolBatcher:
+    """
+    buffers tool calls from concurrent callers and dispatches them in batches.
+    a background worker waits for the first call, gives others up to `max_delay`
+    seconds to join, then runs up to `max_batch` calls together with one gather.
+
+    usage:
+        batcher = ToolBatcher(agent)
+        events = await batcher.submit("search_calendar", state)
+        await batcher.stop()
+    """
+
+    def __init__(self, agent: ReActAgent, max_batch: int = 16, max_delay: float = 0.005):
+        """
+        initialize the batcher for an agent's tools.
+
+        Args:
+            agent (ReActAgent): the agent whose tools are dispatched.
+            max_batch (int): the most calls dispatched together.
+            max_delay (float): how long, in seconds, to wait for a batch to fill.
+        """
+        self.agent = agent
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        # calls taken off the queue but not yet answered, so stop() can cancel them
+        self._batch: List[tuple] = []
+
+    async def submit(self, name: str, state: AcademicState, **kwargs: Any) -> Any:
+        """
+        queue a tool call and wait for its result.
+
+        Args:
+            name (str): name of the tool to run.
+            state (AcademicState): the state passed to the tool.
+
+        Returns:
+            Any: the tool result.
+
+        Raises:
+            ValueError: if the tool is unknown.
+        """
+        tool = self.agent.tools.get(name)
+        if tool is None:
+            raise ValueError(f"Unknown tool: {name}")
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((tool, state, kwargs, future))
+        return await future
+
+    async def stop(self) -> None:
+        """stop the worker and cancel every call not yet answered, in flight or still buffered."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        for *_, future in self._batch:
+            future.cancel()
+        self._batch = []
+        while not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def _run(self) -> None:
+        """collect buffered calls into batches and dispatch each batch at once."""
+        try:
+            while True:
+                self._batch = batch = [await self._queue.get()]
+                # give concurrent callers a moment to join unless the batch is already full
+                if self._queue.qsize() < self.max_batch - 1:
+                    await asyncio.sleep(self.max_delay)
+                while len(batch) < self.max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+                calls, futures = [], []
+                for tool, state, kwargs, future in batch:
+                    # a call that can't even be made, e.g. with bad arguments, fails its caller alone
+                    try:
+                        calls.append(tool(state, **kwargs))
+                    except Exception as exc:
+                        _resolve(future, exc)
+                    else:
+                        futures.append(future)
+
+                results = await asyncio.gather(*calls, return_exceptions=True)
+                self._batch = []
+                for future, result in zip(futures, results):
+                    _resolve(future, result)
+        except Exception as exc:
+            # never leave callers waiting on a dead worker
+            for *_, future in self._batch:
+                _resolve(future, exc)
+            self._batch = []
+            while not self._queue.empty():
+                *_, future = self._queue.get_nowait()
+                _resolve(future, exc)
+
@@ -1,18 +1,18 @@
-from typing import Dict, Type, Optional
+from typing import Dict, Mapping, Type, Optional
+from types import MappingProxyType
+import sys
 from .base_agent import BaseAgent
 
 class AgentRegistry:
     """
     Registry for managing agent types and their implementations.
-    Implements the Singleton pattern to ensure only one registry exists.
+    Use the module-level ``agent_registry`` instance rather than creating new ones.
     """
-    _instance = None
-    _agents: Dict[str, Type[BaseAgent]] = {}
+    __slots__ = ('_agents', '_version')
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(AgentRegistry, cls).__new__(cls)
-        return cls._instance
+    def __init__(self):
+        self._agents: Mapping[str, Type[BaseAgent]] = {}
+        self._version = 0  # bumped on every change so callers can invalidate caches
     
     def register(self, agent_type: str):
         """
@@ -24,10 +24,13 @@ class AgentRegistry:
                 pass
         """
         def wrapper(agent_class: Type[BaseAgent]) -> Type[BaseAgent]:
+            if self.frozen:
+                raise RuntimeError(f"Cannot register {agent_type}: registry is frozen")
             if not issubclass(agent_class, BaseAgent):
                 raise ValueError(f"Agent class {agent_class.__name__} must inherit from BaseAgent")
             
             self._agents[agent_type] = agent_class
+            self._version += 1
             return agent_class
         return wrapper
     
@@ -37,11 +40,32 @@ class AgentRegistry:
     
     def list_agents(self) -> Dict[str, Type[BaseAgent]]:
         """List all registered agent types and their implementations."""
-        return self._agents.copy()
+        return dict(self._agents)
     
     def unregister(self, agent_type: str) -> None:
         """Unregister an agent type."""
-        self._agents.pop(agent_type, None)
+        if self.frozen:
+            raise RuntimeError(f"Cannot unregister {agent_type}: registry is frozen")
+        if self._agents.pop(agent_type, None) is not None:
+            self._version += 1
+    
+    def freeze(self) -> None:
+        """
+        Freeze the registry once all agents are registered.
+        Agent type keys are interned and the table becomes read-only;
+        later register/unregister calls raise RuntimeError.
+        """
+        self._agents = MappingProxyType({sys.intern(k): v for k, v in self._agents.items()})
+    
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry has been frozen."""
+        return isinstance(self._agents, MappingProxyType)
+    
+    @property
+    def version(self) -> int:
+        """Get the current registry version, incremented whenever registrations change."""
+        return self._version
 
 # Global registry instance
 agent_registry = AgentRegistry() 
\ No newline at end of file
@@ -1,8 +1,14 @@
-from fastapi import FastAPI, HTTPException, Depends, Security, status
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import APIKeyHeader
-from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing import Dict, Any, Optional, List, AsyncIterator
+from contextlib import asynccontextmanager
+import hmac
+import orjson
+import sys
+import httpx
 
 from src.config import get_app_config
 from src.agents import AgentState, AgentFactory, agent_registry
@@ -22,9 +28,37 @@ agent_factory = AgentFactory(
 agent_executor = AgentExecutor(agent_factory)
 
 # Initialize API key security
-API_KEY_HEADER = APIKeyHeader(name="X-API-Key")
+API_KEY_HEADER = b"x-api-key"
+# Expected key bound once at startup; None rejects every request
+_API_KEY_BYTES = config.API_KEY.encode() if config.API_KEY else None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Freeze the agent registry and cache the serialized agent list, open a
+    keep-alive HTTP client shared by all agents for the app's lifetime.
+    """
+    # All agents are registered at import time, so lookups can use the frozen table
+    agent_registry.freeze()
+    # The agent list cannot change once the registry is frozen, so serialize it once
+    app.state.agents_json = orjson.dumps(agent_factory.get_available_agents())
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        timeout=config.HTTP_TIMEOUT
+    )
+    app.state.http = http_client
+    agent_factory.dependencies["http"] = http_client
+    try:
+        yield
+    finally:
+        agent_factory.dependencies.pop("http", None)
+        await http_client.aclose()
 
 app = FastAPI(
+    lifespan=lifespan,
     title=config.PROJECT_NAME,
     description="A sophisticated multi-agent system for different personalized use-cases",
     version=config.VERSION,
@@ -32,6 +66,40 @@ app = FastAPI(
     redoc_url=None if config.ENVIRONMENT == "production" else "/redoc"
 )
 
+class APIKeyMiddleware:
+    """
+    ASGI middleware rejecting requests under a protected path prefix
+    that lack a valid X-API-Key header, before any routing or dependency work.
+    """
+    def __init__(self, app: ASGIApp, api_key: Optional[bytes], protected_prefix: str):
+        self.app = app
+        self.api_key = api_key
+        self.protected_prefix = protected_prefix
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.protected_prefix):
+            await self.app(scope, receive, send)
+            return
+        
+        provided = next((value for name, value in scope["headers"] if name == API_KEY_HEADER), None)
+        # Constant-time comparison so the key cannot be recovered from response timing
+        if self.api_key is None or provided is None or not hmac.compare_digest(provided, self.api_key):
+            response = JSONResponse(
+                {"detail": "Invalid API Key"},
+                status_code=status.HTTP_401_UNAUTHORIZED
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+# Protect the versioned API; /health and the docs stay public.
+# Added before CORS so CORS stays outermost and still answers preflight requests.
+app.add_middleware(
+    APIKeyMiddleware,
+    api_key=_API_KEY_BYTES,
+    protected_prefix=config.API_V1_PREFIX
+)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -41,24 +109,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Security dependency
-async def verify_api_key(api_key: str = Security(API_KEY_HEADER)):
-    if api_key != config.API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API Key"
-        )
-    return api_key
-
 # Request Models
 class AgentRequest(BaseModel):
     """Model for agent interaction requests."""
+    model_config = ConfigDict(frozen=True)
+    
     query: str
     context: Optional[Dict[str, Any]] = None
     agent_type: str = "default"
 
 class ChainRequest(BaseModel):
     """Model for agent chain requests."""
+    model_config = ConfigDict(frozen=True)
+    
     query: str
     context: Optional[Dict[str, Any]] = None
     agent_chain: List[str]
@@ -66,6 +129,8 @@ class ChainRequest(BaseModel):
 # Response Models
 class AgentResponse(BaseModel):
     """Model for agent interaction responses."""
+    model_config = ConfigDict(frozen=True)
+    
     success: bool
     message: str
     data: Dict[str, Any] = {}
@@ -82,36 +147,34 @@ async def health_check():
     }
 
 # List available agents endpoint (protected)
-@app.get("/api/v1/agents",
-         dependencies=[Depends(verify_api_key)])
-async def list_agents():
+@app.get("/api/v1/agents")
+async def list_agents(request: Request):
     """Get list of available agents and their descriptions."""
-    return agent_factory.get_available_agents()
+    agents_json = getattr(request.app.state, "agents_json", None)
+    if agents_json is None:
+        # Lifespan has not run, so the registry may still change
+        return agent_factory.get_available_agents()
+    return Response(agents_json, media_type="application/json")
 
 # Agent interaction endpoint (protected)
 @app.post("/api/v1/agent/interact",
-          response_model=AgentResponse,
-          dependencies=[Depends(verify_api_key)])
-async def interact_with_agent(request: AgentRequest):
+          response_model=AgentResponse)
+async def interact_with_agent(request: AgentRequest, response: Response):
     """Protected endpoint for agent interaction."""
+    agent_type = sys.intern(request.agent_type)
+    if agent_registry.get_agent_class(agent_type) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown agent type: {agent_type}"
+        )
+    
     try:
         # Execute agent using executor
         result = await agent_executor.execute_agent(
-            agent_type=request.agent_type,
+            agent_type=agent_type,
             query=request.query,
             context=request.context
         )
-        
-        return AgentResponse(
-            success=True,
-            message="Request processed successfully",
-            data={
-                "query": request.query,
-                "agent_type": request.agent_type,
-                "response": result.messages[-1].content if result.messages else None
-            },
-            state=result
-        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -122,41 +185,67 @@ async def interact_with_agent(request: AgentRequest):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
+    
+    state = result.state
+    if result.success:
+        message = "Request processed successfully"
+    else:
+        # The executor reports failures in the result rather than raising
+        response.status_code = (
+            status.HTTP_504_GATEWAY_TIMEOUT if isinstance(result.error, TimeoutError)
+            else status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+        message = f"Agent execution failed: {result.error}"
+    return AgentResponse(
+        success=result.success,
+        message=message,
+        data={
+            "query": request.query,
+            "agent_type": agent_type,
+            "response": state.messages[-1].content if state.messages else None
+        },
+        state=state
+    )
 
 # Chain execution endpoint (protected)
-@app.post("/api/v1/agent/chain",
-          response_model=AgentResponse,
-          dependencies=[Depends(verify_api_key)])
+@app.post("/api/v1/agent/chain")
 async def execute_agent_chain(request: ChainRequest):
-    """Execute a chain of agents in sequence."""
-    try:
-        results = await agent_executor.execute_chain(
-            agent_chain=request.agent_chain,
-            initial_query=request.query,
-            context=request.context
-        )
-        
-        # Get final result
-        final_result = results[-1] if results else None
-        
-        return AgentResponse(
-            success=True,
-            message="Chain executed successfully",
-            data={
-                "query": request.query,
-                "chain": request.agent_chain,
-                "all_states": results,
-                "response": final_result.messages[-1].content if final_result and final_result.messages else None
-            },
-            state=final_result
-        )
-    except ValueError as e:
+    """
+    Execute a chain of agents in sequence.
+    Streams one NDJSON line per agent as it finishes, so clients see the
+    first result without waiting for the whole chain.
+    """
+    agent_chain = [sys.intern(agent_type) for agent_type in request.agent_chain]
+    unknown = [t for t in agent_chain if agent_registry.get_agent_class(t) is None]
+    if unknown:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown agent type: {unknown[0]}"
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        ) 
\ No newline at end of file
+    
+    async def stream_results() -> AsyncIterator[bytes]:
+        agent_type = None
+        try:
+            async for result in agent_executor.iter_chain(
+                agent_chain=agent_chain,
+                query=request.query,
+                context=dict(request.context) if request.context else None
+            ):
+                agent_type = result.agent_type
+                state = result.state
+                yield orjson.dumps({
+                    "agent_type": agent_type,
+                    "status": result.status.value,
+                    "response": state.messages[-1].content if state.messages else None,
+                    "state": state.model_dump(mode="json")
+                }) + b"\n"
+        except Exception as e:
+            # The 200 status is already sent, so report the failure as a last line
+            # rather than cutting the stream short
+            yield orjson.dumps({
+                "agent_type": agent_type,
+                "status": "error",
+                "error": f"Chain execution failed: {e}"
+            }) + b"\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
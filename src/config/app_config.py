@@ -12,6 +12,15 @@ class EnvironmentType(str, Enum):
     STAGING = "staging"
     PRODUCTION = "production"
 
+@lru_cache(maxsize=1)
+def _read_secrets(path: str, mtime_ns: int) -> dict:
+    """
+    Parse a local secrets file.
+    Cached by modification time, so the file is re-read only after it changes.
+    """
+    with open(path) as f:
+        return json.load(f)
+
 class AppConfig(BaseSettings):
     """Application configuration loaded from environment variables and secrets."""
     
@@ -39,6 +48,11 @@ class AppConfig(BaseSettings):
     
     # Caching
     REDIS_URL: Optional[str] = None
+    
+    # Outbound HTTP connection pool shared by agents (LLM / vector DB calls)
+    HTTP_MAX_CONNECTIONS: int = 200
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 100
+    HTTP_TIMEOUT: float = 30.0
 
     class Config:
         env_file = ".env"
@@ -59,12 +73,14 @@ class AppConfig(BaseSettings):
 
         # For development, load from local secrets file (not for production use)
         secrets_file = Path(".secrets.json")
-        if secrets_file.exists():
-            with open(secrets_file) as f:
-                secrets = json.load(f)
-                for key, value in secrets.items():
-                    if hasattr(self, key):
-                        setattr(self, key, value)
+        try:
+            mtime_ns = secrets_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        secrets = _read_secrets(str(secrets_file), mtime_ns)
+        for key, value in secrets.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
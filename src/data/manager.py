@@ -1,11 +1,20 @@
-from typing import Dict, Any, List, Optional, Union, Protocol
-from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple, Union, Protocol, runtime_checkable
+import asyncio
 import json
-from pydantic import ValidationError
+import logging
+import sys
+import orjson
+from pydantic import TypeAdapter, ValidationError
 from src.utils.academic_states import StudentProfile, CalendarEvent, AcademicTask
 
+logger = logging.getLogger(__name__)
+
+@runtime_checkable
 class DataStore(Protocol):
     """protocol for data storage implementations"""
+    # empty slots, so implementations can declare their own __slots__ and drop __dict__
+    __slots__ = ()
+
     async def store(self, key: str, data: Dict[str, Any]) -> None:
         """store data with given key"""
         ... # abstract method
@@ -20,6 +29,8 @@ class DataStore(Protocol):
 
 class MemoryStore(DataStore):
     """in-memory implementation of the DataStore protocol"""
+    __slots__ = ("_store",)
+
     def __init__(self):
         self._store: Dict[str, Dict[str, Any]] = {}
 
@@ -32,6 +43,34 @@ class MemoryStore(DataStore):
     async def delete(self, key: str) -> None:
         self._store.pop(key, None)
 
+# JSON payloads larger than this are parsed in a worker thread to keep the event loop responsive
+_OFFLOAD_PARSE_BYTES = 64 * 1024
+
+# validators built once and reused for every load; ISO 8601 times are parsed to datetimes during validation
+_PROFILE_ADAPTER = TypeAdapter(StudentProfile)
+_EVENTS_ADAPTER = TypeAdapter(List[CalendarEvent])
+_TASKS_ADAPTER = TypeAdapter(List[AcademicTask])
+
+async def _parse_json(data: Union[str, bytes, Dict]) -> Dict[str, Any]:
+    """parse a JSON payload with orjson, offloading large payloads to a thread; dicts are returned as-is"""
+    if isinstance(data, dict):
+        return data
+    if len(data) > _OFFLOAD_PARSE_BYTES:
+        return await asyncio.to_thread(orjson.loads, data)
+    return orjson.loads(data)
+
+# record fields holding containers, copied along with the record by the getters
+_NESTED_FIELDS = ("metadata", "attachments")
+
+def _copy_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """copy a stored record along with its metadata and attachments containers"""
+    copy = dict(record)
+    for field in _NESTED_FIELDS:
+        value = copy.get(field)
+        if value is not None:
+            copy[field] = value.copy()
+    return copy
+
 class DataValidationError(Exception):
     """custom exception for data validation errors"""
     def __init__(self, message: str, details: Dict[str, Any]):
@@ -39,6 +78,22 @@ class DataValidationError(Exception):
         self.details = details
         super().__init__(message)
 
+def _validate_items(adapter: TypeAdapter, items: List[Dict[str, Any]], kind: str) -> List[Dict[str, Any]]:
+    """
+    validate a whole list of items in one pass, reporting failures per item.
+    raises DataValidationError whose details map each failing item index to its error messages.
+    """
+    try:
+        return adapter.validate_python(items, strict=False)
+    except ValidationError as e:
+        details: Dict[Any, List[str]] = {}
+        for error in e.errors():
+            loc = error["loc"]
+            index = loc[0] if loc else None
+            field = ".".join(str(part) for part in loc[1:])
+            details.setdefault(index, []).append(f"{field}: {error['msg']}" if field else error["msg"])
+        raise DataValidationError(f"{len(details)} invalid {kind}", details) from e
+
 class DataManager:
     """
     centralized data manager for all data operations. 
@@ -56,29 +111,26 @@ class DataManager:
 
     async def load_data(
         self,
-        profile_data: Union[str, Dict],
-        calendar_data: Union[str, Dict],
-        task_data: Union[str, Dict]
+        profile_data: Union[str, bytes, Dict],
+        calendar_data: Union[str, bytes, Dict],
+        task_data: Union[str, bytes, Dict]
     ) -> bool:
         """
-        Load and validate data using Pydantic models.
+        Load and validate data using Pydantic type adapters.
 
         Args:
-            profile_data: JSON string or dict containing user profile data
-            calendar_data: JSON string or dict containing calendar data
-            task_data: JSON string or dict containing task data
+            profile_data: JSON string/bytes or dict containing user profile data
+            calendar_data: JSON string/bytes or dict containing calendar data
+            task_data: JSON string/bytes or dict containing task data
 
         Returns:
             bool: True if data is loaded and validated successfully, False otherwise
         """
         try:
             # Parse JSON if needed
-            profile = profile_data if isinstance(profile_data, dict) else json.loads(profile_data)
-            calendar = calendar_data if isinstance(calendar_data, dict) else json.loads(calendar_data)
-            tasks = task_data if isinstance(task_data, dict) else json.loads(task_data)
-
-            # Debug print
-            print(f"Input profile data: {profile}")
+            profile = await _parse_json(profile_data)
+            calendar = await _parse_json(calendar_data)
+            tasks = await _parse_json(task_data)
 
             # Validate data structure
             if "events" not in calendar:
@@ -86,32 +138,30 @@ class DataManager:
             if "tasks" not in tasks:
                 tasks["tasks"] = []
 
-            # Create and validate Pydantic models
-            student_profile = StudentProfile(**profile)
-            events = [CalendarEvent(**event) for event in calendar["events"]]
-            task_list = [AcademicTask(**task) for task in tasks["tasks"]]
+            # Validate each collection in a single pass
+            student_profile = _PROFILE_ADAPTER.validate_python(profile, strict=False)
+            events = _validate_items(_EVENTS_ADAPTER, calendar["events"], "calendar events")
+            task_list = _validate_items(_TASKS_ADAPTER, tasks["tasks"], "tasks")
 
-            # Debug print
-            print(f"Created profile: {student_profile}")
-            
-            # Get profile ID from the validated model
-            profile_id = student_profile.id
+            # Get profile ID from the validated profile
+            profile_id = student_profile.get("id")
             if profile_id is None:
                 print("Profile ID cannot be None")
                 return False
 
-            # Store validated Pydantic models as dictionaries
-            await self.store.store(
-                f"profile_{profile_id}", 
-                student_profile.model_dump()
-            )
-            await self.store.store(
-                f"calendar_{profile_id}", 
-                {"events": [event.model_dump() for event in events]}
-            )
-            await self.store.store(
-                f"tasks_{profile_id}", 
-                {"tasks": [task.model_dump() for task in task_list]}
+            # type and status take only a handful of values; interning them lets every
+            # stored record share one string per value, compared by identity
+            student_profile["type"] = sys.intern(student_profile["type"])
+            for event in events:
+                event["type"] = sys.intern(event["type"])
+            for task in task_list:
+                task["status"] = sys.intern(task["status"])
+
+            # Store the validated dictionaries; the writes are independent, so issue them together
+            await asyncio.gather(
+                self.store.store(f"profile_{profile_id}", student_profile),
+                self.store.store(f"calendar_{profile_id}", {"events": events}),
+                self.store.store(f"tasks_{profile_id}", {"tasks": task_list})
             )
 
             return True
@@ -121,6 +171,9 @@ class DataManager:
         except ValidationError as e:
             print(f"Validation error: {e}")
             return False
+        except DataValidationError as e:
+            logger.warning("Validation error: %s: %s", e.message, e.details)
+            return False
         except Exception as e:
             print(f"Unexpected error: {e}")
             return False
@@ -147,34 +200,41 @@ class DataManager:
 
     async def get_calendar(self, profile_id: str) -> List[CalendarEvent]:
         """
-        Get calendar events as CalendarEvent models.
-        Returns empty list if no events or validation fails.
+        Get calendar events as CalendarEvent dicts.
+        Events were validated by load_data when stored, so they are returned without re-validation;
+        each event is a copy, as is its metadata, so callers can edit them without changing
+        the stored data; values nested inside the metadata are still shared.
+        Returns empty list if no events.
         """
         data = await self.store.retrieve(f"calendar_{profile_id}")
         if data is None:
             return []
-        try:
-            return [CalendarEvent(**event) for event in data.get("events", [])]
-        except ValidationError as e:
-            print(f"Validation error retrieving calendar: {e}")
-            return []
-        except Exception as e:
-            print(f"Error retrieving calendar: {e}")
-            return []
+        return [_copy_record(event) for event in data.get("events", ())]
 
     async def get_tasks(self, profile_id: str) -> List[AcademicTask]:
         """
-        Get tasks as AcademicTask models.
-        Returns empty list if no tasks or validation fails.
+        Get tasks as AcademicTask dicts.
+        Tasks were validated by load_data when stored, so they are returned without re-validation;
+        each task is a copy, as are its metadata and attachments, so callers can edit them
+        without changing the stored data; values nested inside the metadata are still shared.
+        Returns empty list if no tasks.
         """
         data = await self.store.retrieve(f"tasks_{profile_id}")
         if data is None:
             return []
-        try:
-            return [AcademicTask(**task) for task in data.get("tasks", [])]
-        except ValidationError as e:
-            print(f"Validation error retrieving tasks: {e}")
-            return []
-        except Exception as e:
-            print(f"Error retrieving tasks: {e}")
-            return []
\ No newline at end of file
+        return [_copy_record(task) for task in data.get("tasks", ())]
+
+    async def get_bundle(
+        self, profile_id: str
+    ) -> Tuple[Optional[StudentProfile], List[CalendarEvent], List[AcademicTask]]:
+        """
+        Get the profile, calendar events and tasks for a profile in one call.
+        The three lookups are independent, so they are issued concurrently.
+        Returns the same values as get_profile, get_calendar and get_tasks.
+        """
+        profile, calendar, tasks = await asyncio.gather(
+            self.get_profile(profile_id),
+            self.get_calendar(profile_id),
+            self.get_tasks(profile_id)
+        )
+        return profile, calendar, tasks
@@ -0,0 +1,106 @@
+import pytest
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+from src.config import get_app_config
+from src.agents import AgentState, AgentFactory, AgentRegistry, BaseAgent
+from src.agents.executor import AgentExecutor
+from src.data.manager import DataManager, DataStore, MemoryStore
+
+# Fixed timestamp for test data; no test asserts on times
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line("markers", "performance: executor load and scaling tests")
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run the performance tests on uvloop, as the server does, when it is available."""
+    if item.get_closest_marker("performance"):
+        try:
+            import uvloop
+        except ImportError:  # uvloop is not available on Windows
+            pass
+        else:
+            return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+class FailingStore(DataStore):
+    """Mock data store whose every operation fails, for testing error handling."""
+    async def store(self, key: str, data: Dict[str, Any]) -> None:
+        raise Exception("Mock store failure")
+    
+    async def retrieve(self, key: str) -> Optional[Dict[str, Any]]:
+        raise Exception("Mock store failure")
+    
+    async def delete(self, key: str) -> None:
+        raise Exception("Mock store failure")
+
+class MinimalDataStore(DataStore):
+    """Minimal implementation of the DataStore interface, for interface tests."""
+    async def store(self, key: str, data: Dict[str, Any]) -> None:
+        pass
+    
+    async def retrieve(self, key: str) -> Optional[Dict[str, Any]]:
+        return {}
+    
+    async def delete(self, key: str) -> None:
+        pass
+
+@pytest.fixture
+def minimal_store():
+    """Create a minimal DataStore implementation for testing."""
+    return MinimalDataStore()
+
+@pytest.fixture
+def memory_store():
+    """Create a memory store instance for testing."""
+    return MemoryStore()
+
+@pytest.fixture
+def data_manager(memory_store):
+    """Create a test instance of DataManager backed by a memory store."""
+    return DataManager(store=memory_store)
+
+@pytest.fixture
+def failing_data_manager():
+    """Create a test instance of DataManager with failing store."""
+    return DataManager(store=FailingStore())
+
+class MockAgent(BaseAgent):
+    """Mock agent that completes immediately, echoing its input."""
+    def _create_state_graph(self):
+        return None
+    
+    async def process(self, state: AgentState):
+        return state, "end"
+    
+    async def execute(self, initial_input: str = None, context: Dict[str, Any] = None) -> AgentState:
+        # Yield to the event loop once, like a real agent awaiting I/O
+        await asyncio.sleep(0)
+        state = AgentState.construct_trusted(messages=[], context=dict(context) if context else {}, status="completed")
+        if initial_input:
+            self.add_message_to_state(state, initial_input, role="ai")
+        return state
+
+@pytest.fixture
+def agent_registry():
+    """Create an isolated agent registry for testing."""
+    return AgentRegistry()
+
+@pytest.fixture
+def register_mock_agents(agent_registry):
+    """Register the mock agent as "test_agent"."""
+    agent_registry.register("test_agent")(MockAgent)
+    return agent_registry
+
+@pytest.fixture
+def executor(agent_registry):
+    """Create an agent executor over the isolated registry."""
+    factory = AgentFactory(registry=agent_registry, config=get_app_config())
+    return AgentExecutor(factory)
+
+@pytest.fixture
+def mock_context():
+    """Create a mutable context for agent executions."""
+    return {"user_id": "test_user"}
@@ -3,28 +3,35 @@ from src.utils.academic_states import (
     AcademicTask, ProgressMetric, FeedbackItem, InteractionResult
 )
 import pytest
-from datetime import datetime
+from src.tests.conftest import NOW
+
+def _academic_state(**fields) -> AcademicState:
+    """Build an AcademicState with empty containers for every field not given"""
+    defaults = {
+        "calendar": {},
+        "upcoming_events": [],
+        "tasks": {},
+        "active_tasks": [],
+        "completed_tasks": [],
+        "progress": {},
+        "learning_resources": {},
+        "study_plans": {},
+        "results": {},
+        "feedback": [],
+        "validation": {"is_valid": True, "errors": []},
+        "notifications": []
+    }
+    return AcademicState(**{**defaults, **fields})
 
 @pytest.fixture
 def base_academic_state():
     """Base fixture with minimal required fields"""
-    return AcademicState(
+    return _academic_state(
         profile={
             "id": "student456",
-            "name": "Jane Smith"
-        },
-        calendar={},
-        upcoming_events=[],
-        tasks={},
-        active_tasks=[],
-        completed_tasks=[],
-        progress={},
-        learning_resources={},
-        study_plans={},
-        results={},
-        feedback=[],
-        validation={"is_valid": True, "errors": []},
-        notifications=[]
+            "name": "Jane Smith",
+            "type": "student"
+        }
     )
 
 def test_student_profile_minimal():
@@ -59,8 +66,8 @@ def test_calendar_event():
         "id": "evt1",
         "title": "Lecture",
         "type": "class",
-        "start_time": datetime.now(),
-        "end_time": datetime.now(),
+        "start_time": NOW,
+        "end_time": NOW,
         "description": "CS Lecture",
         "metadata": {}
     }
@@ -68,10 +75,11 @@ def test_calendar_event():
 
 def test_state_merging(base_academic_state):
     """Test merging of academic states"""
-    other_state = AcademicState(
+    other_state = _academic_state(
         profile={
             "id": "student123",
             "name": "John Doe",
+            "type": "student",
             "level": None,
             "major": None,
             "courses": ["CS102"],
@@ -79,18 +87,7 @@ def test_state_merging(base_academic_state):
             "preferences": {},
             "history": []
         },
-        calendar={},
-        upcoming_events=[],
-        tasks={},
-        active_tasks=[],
-        completed_tasks=["task123"],
-        progress={},
-        learning_resources={},
-        study_plans={},
-        results={},
-        feedback=[],
-        validation={"is_valid": True, "errors": []},
-        notifications=[]
+        completed_tasks=["task123"]
     )
 
     merged = base_academic_state.merge(other_state)
@@ -103,7 +100,7 @@ def test_progress_metrics():
     metric: ProgressMetric = {
         "metric_type": "grade",
         "value": 95.5,
-        "timestamp": datetime.now(),
+        "timestamp": NOW,
         "metadata": {"course": "CS101"}
     }
     assert metric["value"] == 95.5
@@ -114,7 +111,7 @@ def test_feedback_items():
         "feedback_type": "suggestion",
         "content": "Great work!",
         "context": {},
-        "timestamp": datetime.now()
+        "timestamp": NOW
     }
     assert feedback["feedback_type"] == "suggestion"
 
@@ -124,7 +121,7 @@ def test_academic_task():
         "id": "task1",
         "title": "Assignment 1",
         "description": "Complete homework",
-        "due_date": datetime.now(),
+        "due_date": NOW,
         "status": "pending",
         "priority": 1,
         "attachments": [],
@@ -138,29 +135,57 @@ def test_interaction_result():
     result: InteractionResult = {
         "Interaction_type": "quiz",
         "content": {"score": 90},
-        "timestamp": datetime.now(),
+        "timestamp": NOW,
         "metadata": {}
     }
     assert result["Interaction_type"] == "quiz"
 
 def test_state_list_reducers(base_academic_state):
     """Test list reducers in state merging"""
-    other_state = AcademicState(
-        profile={"id": "student123", "name": "John"},
-        calendar={},
+    other_state = _academic_state(
+        profile={"id": "student123", "name": "John", "type": "student"},
         upcoming_events=["event1"],
-        tasks={},
-        active_tasks=["task1", "task1"],  # Duplicate to test unique reducer
-        completed_tasks=[],
-        progress={},
-        learning_resources={},
-        study_plans={},
-        results={},
-        feedback=[],
-        validation={"is_valid": True, "errors": []},
-        notifications=[]
+        active_tasks=["task1", "task1"]  # Duplicate to test unique reducer
     )
     
     merged = base_academic_state.merge(other_state)
     assert len(merged.active_tasks) == 1  # Tests unique reducer
     assert "event1" in merged.upcoming_events  # Tests append reducer
+
+def test_state_merge_inplace():
+    """Test in-place merging of academic states"""
+    state = _academic_state(
+        profile={"id": "student123", "name": "John", "type": "student"},
+        notifications=[{"message": "first"}],
+        active_tasks=["task1"]
+    )
+    other_state = _academic_state(
+        profile={"id": "student123", "name": "John", "type": "student", "level": "graduate"},
+        notifications=[{"message": "second"}],
+        active_tasks=["task1", "task2"]
+    )
+    notifications = state.notifications
+
+    merged = state.merge_inplace(other_state)
+    assert merged is state
+    assert state.notifications is notifications  # Extended, not copied
+    assert [n["message"] for n in state.notifications] == ["first", "second"]
+    assert state.active_tasks == ["task1", "task2"]
+    assert state.profile["level"] == "graduate"
+    assert other_state.notifications == [{"message": "second"}]
+
+def test_state_merge_inplace_copies_shared_context():
+    """Test that in-place merging never writes into a context the state shares"""
+    shared_context = {"user_id": "student123"}
+    state = _academic_state(
+        profile={"id": "student123", "name": "John", "type": "student"}
+    )
+    state.context = shared_context
+    other_state = _academic_state(
+        profile={"id": "student123", "name": "John", "type": "student"},
+        context={"session": "abc"}
+    )
+
+    state.merge_inplace(other_state)
+    assert state.context == {"user_id": "student123", "session": "abc"}
+    assert shared_context == {"user_id": "student123"}
@@ -0,0 +1,160 @@
+import pytest
+import orjson
+from fastapi.testclient import TestClient
+from langchain.schema import AIMessage
+
+from src.agents import AgentState, BaseAgent
+from src.api import main
+
+API_KEY = "test-key"
+
+class TalkingAgent(BaseAgent):
+    """Agent that answers with a LangChain message."""
+    def _create_state_graph(self):
+        return None
+
+    async def process(self, state):
+        return state, "end"
+
+    async def execute(self, initial_input=None, context=None):
+        return AgentState.construct_trusted(
+            messages=[AIMessage(content=f"answer to {initial_input}")],
+            context=dict(context) if context else {},
+            status="completed"
+        )
+
+class UnserializableAgent(TalkingAgent):
+    """Agent that leaves a value in its context that can't be dumped to JSON."""
+    async def execute(self, initial_input=None, context=None):
+        state = await super().execute(initial_input, context)
+        state.context["handle"] = object()
+        return state
+
+class FailingAgent(TalkingAgent):
+    """Agent whose execution always raises."""
+    async def execute(self, initial_input=None, context=None):
+        raise RuntimeError("agent failure")
+
+@pytest.fixture
+def api_client(agent_registry, executor, monkeypatch):
+    """Create a test client over the isolated registry, authenticated with a test key."""
+    agent_registry.register("talking_agent")(TalkingAgent)
+    agent_registry.register("unserializable_agent")(UnserializableAgent)
+    agent_registry.register("failing_agent")(FailingAgent)
+    monkeypatch.setattr(main, "agent_registry", agent_registry)
+    monkeypatch.setattr(main, "agent_executor", executor)
+    # The key is bound when the middleware stack is built, so rebuild it with the test key
+    for middleware in main.app.user_middleware:
+        if middleware.cls is main.APIKeyMiddleware:
+            monkeypatch.setitem(middleware.kwargs, "api_key", API_KEY.encode())
+    monkeypatch.setattr(main.app, "middleware_stack", None)
+    return TestClient(main.app, headers={"X-API-Key": API_KEY})
+
+def read_lines(response):
+    """Parse an NDJSON response body."""
+    return [orjson.loads(line) for line in response.text.splitlines()]
+
+def test_interact_returns_agent_messages(api_client):
+    """
+    Test the interact endpoint with an agent that answers with a message.
+    Verifies:
+    - The response succeeds instead of failing to serialize the message
+    - The agent's answer and its serialized messages are returned
+    """
+    response = api_client.post(
+        "/api/v1/agent/interact",
+        json={"query": "hi", "agent_type": "talking_agent"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert body["data"]["response"] == "answer to hi"
+    assert body["state"]["messages"][0]["data"]["content"] == "answer to hi"
+
+def test_interact_reports_agent_failure(api_client):
+    """
+    Test the interact endpoint with an agent that raises.
+    Verifies:
+    - The failure is returned as an unsuccessful result with status 500
+    - The agent's error is included in the message and state
+    """
+    response = api_client.post(
+        "/api/v1/agent/interact",
+        json={"query": "hi", "agent_type": "failing_agent"}
+    )
+
+    assert response.status_code == 500
+    body = response.json()
+    assert body["success"] is False
+    assert body["message"] == "Agent execution failed: agent failure"
+    assert body["state"]["error"] == "agent failure"
+
+def test_interact_ignores_unknown_fields(api_client):
+    """
+    Test requests carrying fields the API doesn't define.
+    Verifies:
+    - Extra fields are ignored rather than rejected, as existing clients expect
+    """
+    response = api_client.post(
+        "/api/v1/agent/interact",
+        json={"query": "hi", "agent_type": "talking_agent", "client_version": "1.2"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+
+@pytest.mark.parametrize("path, payload", [
+    ("/api/v1/agent/interact", {"query": "hi", "agent_type": "missing_agent"}),
+    ("/api/v1/agent/chain", {"query": "hi", "agent_chain": ["talking_agent", "missing_agent"]}),
+])
+def test_unknown_agent_type_is_not_found(api_client, path, payload):
+    """
+    Test requests naming an unregistered agent type.
+    Verifies:
+    - Both endpoints reject them with 404 before running any agent
+    """
+    response = api_client.post(path, json=payload)
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Unknown agent type: missing_agent"
+
+def test_chain_streams_agent_messages(api_client):
+    """
+    Test the chain endpoint streams one line per agent.
+    Verifies:
+    - Agents answering with LangChain messages are streamed, not truncated
+    - Each line carries the agent's response and its serialized messages
+    """
+    response = api_client.post(
+        "/api/v1/agent/chain",
+        json={"query": "hi", "agent_chain": ["talking_agent", "talking_agent"]}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = read_lines(response)
+    assert [line["status"] for line in lines] == ["completed", "completed"]
+    assert all(line["response"] == "answer to hi" for line in lines)
+    message = lines[0]["state"]["messages"][0]
+    assert message["type"] == "ai"
+    assert message["data"]["content"] == "answer to hi"
+
+def test_chain_reports_stream_failures(api_client):
+    """
+    Test a failure after streaming has started.
+    Verifies:
+    - Lines already produced are kept
+    - The failure is reported as a final error line instead of an empty or cut body
+    """
+    response = api_client.post(
+        "/api/v1/agent/chain",
+        json={"query": "hi", "agent_chain": ["talking_agent", "unserializable_agent"]}
+    )
+
+    assert response.status_code == 200
+    first, error = read_lines(response)
+    assert first["status"] == "completed"
+    assert error["agent_type"] == "unserializable_agent"
+    assert error["status"] == "error"
+    assert error["error"].startswith("Chain execution failed")
@@ -1,43 +1,11 @@
 import pytest
-from datetime import datetime, timezone, timedelta
-import json
-from typing import Dict, Any, Optional
+import orjson
 
-from src.data.manager import DataManager, DataStore, MemoryStore
-from src.utils.academic_states import StudentProfile, CalendarEvent, AcademicTask
+from src.tests.conftest import NOW
 
-class MockStore(DataStore):
-    """Mock data store for testing."""
-    def __init__(self, should_fail: bool = False):
-        self._store: Dict[str, Dict[str, Any]] = {}
-        self.should_fail = should_fail
-    
-    async def store(self, key: str, data: Dict[str, Any]) -> None:
-        if self.should_fail:
-            raise Exception("Mock store failure")
-        self._store[key] = data
-    
-    async def retrieve(self, key: str) -> Optional[Dict[str, Any]]:
-        if self.should_fail:
-            raise Exception("Mock store failure")
-        return self._store.get(key)
-    
-    async def delete(self, key: str) -> None:
-        if self.should_fail:
-            raise Exception("Mock store failure")
-        self._store.pop(key, None)
-
-@pytest.fixture
-def data_manager():
-    """Create a test instance of DataManager."""
-    return DataManager(store=MemoryStore())
-
-@pytest.fixture
-def failing_data_manager():
-    """Create a test instance of DataManager with failing store."""
-    return DataManager(store=MockStore(should_fail=True))
-
-@pytest.fixture
+# The sample fixtures are module-scoped and shared between tests,
+# so tests must copy before mutating.
+@pytest.fixture(scope="module")
 def sample_profile():
     """Create a sample profile for testing."""
     return {
@@ -55,35 +23,33 @@ def sample_profile():
         "history": []
     }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_calendar():
     """Create sample calendar events for testing."""
-    now = datetime.now(timezone.utc)
     return {
         "events": [
             {
                 "id": "evt1",
                 "title": "Study Session",
                 "type": "study",
-                "start_time": now,
-                "end_time": now,
+                "start_time": NOW,
+                "end_time": NOW,
                 "description": "Python Basics",
                 "metadata": {}
             }
         ]
     }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_tasks():
     """Create sample tasks for testing."""
-    now = datetime.now(timezone.utc)
     return {
         "tasks": [
             {
                 "id": "task1",
                 "title": "Complete Exercise",
                 "description": "Python exercises",
-                "due_date": now,
+                "due_date": NOW,
                 "status": "pending",
                 "priority": 1,
                 "attachments": [],
@@ -115,7 +81,7 @@ class TestDataManager:
         # Verify data was stored correctly
         profile = await data_manager.get_profile("test123")
         assert profile is not None
-        assert profile.name == "Test User"
+        assert profile["name"] == "Test User"
 
     async def test_load_data_json_input(self, data_manager, sample_profile, sample_calendar, sample_tasks):
         """
@@ -127,16 +93,16 @@ class TestDataManager:
         - Proper storage of parsed data
         """
         result = await data_manager.load_data(
-            profile_data=json.dumps(sample_profile),
-            calendar_data=json.dumps(sample_calendar),
-            task_data=json.dumps(sample_tasks)
+            profile_data=orjson.dumps(sample_profile),
+            calendar_data=orjson.dumps(sample_calendar),
+            task_data=orjson.dumps(sample_tasks)
         )
         assert result is True
 
         # Verify data was stored correctly
         profile = await data_manager.get_profile("test123")
         assert profile is not None
-        assert profile.name == "Test User"
+        assert profile["name"] == "Test User"
 
     async def test_load_data_invalid_json(self, data_manager):
         """
@@ -170,21 +136,36 @@ class TestDataManager:
         )
         assert result is False
 
+    async def test_load_data_logs_invalid_items(self, data_manager, sample_profile, sample_calendar, sample_tasks, caplog):
+        """
+        Test load_data with one invalid calendar event.
+        Verifies:
+        - Return value is False on validation error
+        - The failing item and field are logged as a warning
+        """
+        invalid_calendar = {"events": [*sample_calendar["events"], {"id": "evt2"}]}
+
+        with caplog.at_level("WARNING", logger="src.data.manager"):
+            result = await data_manager.load_data(sample_profile, invalid_calendar, sample_tasks)
+        assert result is False
+        assert "1 invalid calendar events" in caplog.text
+        assert "title: Field required" in caplog.text
+
     async def test_get_profile_existing(self, data_manager, sample_profile, sample_calendar, sample_tasks):
         """
         Test get_profile for existing profile.
         Verifies:
         - Retrieval of stored profile
-        - Correct conversion to StudentProfile model
+        - Stored fields are returned as a StudentProfile dict
         - All fields are preserved
         """
         await data_manager.load_data(sample_profile, sample_calendar, sample_tasks)
         
         profile = await data_manager.get_profile("test123")
         assert profile is not None
-        assert profile.id == "test123"
-        assert profile.name == "Test User"
-        assert profile.type == "student"
+        assert profile["id"] == "test123"
+        assert profile["name"] == "Test User"
+        assert profile["type"] == "student"
 
     async def test_get_profile_nonexistent(self, data_manager):
         """
@@ -201,15 +182,15 @@ class TestDataManager:
         Test get_calendar for existing calendar.
         Verifies:
         - Retrieval of stored calendar events
-        - Correct conversion to CalendarEvent model
+        - Events are returned as CalendarEvent dicts
         - All events are preserved
         """
         await data_manager.load_data(sample_profile, sample_calendar, sample_tasks)
         
         events = await data_manager.get_calendar("test123")
         assert len(events) == 1
-        assert events[0].id == "evt1"
-        assert events[0].title == "Study Session"
+        assert events[0]["id"] == "evt1"
+        assert events[0]["title"] == "Study Session"
 
     async def test_get_calendar_nonexistent(self, data_manager):
         """
@@ -226,16 +207,16 @@ class TestDataManager:
         Test get_tasks for existing tasks.
         Verifies:
         - Retrieval of stored tasks
-        - Correct conversion to AcademicTask model
+        - Tasks are returned as AcademicTask dicts
         - All tasks are preserved
         """
         await data_manager.load_data(sample_profile, sample_calendar, sample_tasks)
         
         tasks = await data_manager.get_tasks("test123")
         assert len(tasks) == 1
-        assert tasks[0].id == "task1"
-        assert tasks[0].title == "Complete Exercise"
-        assert tasks[0].status == "pending"
+        assert tasks[0]["id"] == "task1"
+        assert tasks[0]["title"] == "Complete Exercise"
+        assert tasks[0]["status"] == "pending"
 
     async def test_get_tasks_nonexistent(self, data_manager):
         """
@@ -247,6 +228,43 @@ class TestDataManager:
         tasks = await data_manager.get_tasks("nonexistent")
         assert len(tasks) == 0
 
+    async def test_returned_records_are_copies(self, data_manager, sample_profile, sample_calendar, sample_tasks):
+        """
+        Test that editing returned records leaves the stored data unchanged.
+        Verifies:
+        - Calendar events are returned as copies, metadata included
+        - Tasks are returned as copies, metadata and attachments included
+        """
+        await data_manager.load_data(sample_profile, sample_calendar, sample_tasks)
+
+        events = await data_manager.get_calendar("test123")
+        tasks = await data_manager.get_tasks("test123")
+        events[0]["title"] = "Changed"
+        events[0]["metadata"]["room"] = "101"
+        tasks[0]["status"] = "completed"
+        tasks[0]["metadata"]["grade"] = "A"
+        tasks[0]["attachments"].append("notes.pdf")
+
+        events = await data_manager.get_calendar("test123")
+        tasks = await data_manager.get_tasks("test123")
+        assert events[0]["title"] == "Study Session"
+        assert events[0]["metadata"] == {}
+        assert tasks[0]["status"] == "pending"
+        assert tasks[0]["metadata"] == {}
+        assert tasks[0]["attachments"] == []
+
+    async def test_get_bundle_nonexistent(self, data_manager):
+        """
+        Test get_bundle for a non-existent profile.
+        Verifies:
+        - Handling of non-existent profile ID
+        - Returns the same defaults as the individual getters
+        """
+        profile, events, tasks = await data_manager.get_bundle("nonexistent")
+        assert profile is None
+        assert events == []
+        assert tasks == []
+
     async def test_store_failure(self, failing_data_manager, sample_profile, sample_calendar, sample_tasks):
         """
         Test handling of storage failures.
@@ -1,4 +1,5 @@
 import pytest
+import asyncio
 from typing import Dict, Any
 from src.data.manager import DataStore, MemoryStore
 
@@ -13,11 +14,6 @@ def sample_data() -> Dict[str, Any]:
 class TestMemoryStore:
     """Test suite for MemoryStore implementation."""
     
-    @pytest.fixture
-    def memory_store(self):
-        """Create a memory store instance for testing."""
-        return MemoryStore()
-
     @pytest.mark.asyncio
     async def test_store_and_retrieve(self, memory_store: MemoryStore, sample_data):
         """
@@ -28,8 +24,7 @@ class TestMemoryStore:
         - Multiple key-value pairs can be stored
         """
         # Store multiple items
-        for key, value in sample_data.items():
-            await memory_store.store(key, value)
+        await asyncio.gather(*[memory_store.store(key, value) for key, value in sample_data.items()])
         
         # Retrieve and verify each item
         for key, expected_value in sample_data.items():
@@ -91,32 +86,35 @@ class TestMemoryStore:
         assert result == updated_value
 
     @pytest.mark.asyncio
-    async def test_store_different_types(self, memory_store: MemoryStore):
+    @pytest.mark.parametrize("key,value", [
+        ("string_key", "string_value"),
+        ("int_key", 42),
+        ("float_key", 3.14),
+        ("list_key", [1, 2, 3]),
+        ("dict_key", {"nested": "value"}),
+        ("bool_key", True),
+        ("none_key", None)
+    ])
+    async def test_store_different_types(self, memory_store: MemoryStore, key, value):
         """
         Test storing different data types.
         Verifies:
         - Different Python types can be stored and retrieved
         - Data integrity is maintained for different types
         """
-        test_data = {
-            "string_key": "string_value",
-            "int_key": 42,
-            "float_key": 3.14,
-            "list_key": [1, 2, 3],
-            "dict_key": {"nested": "value"},
-            "bool_key": True,
-            "none_key": None
-        }
-        
-        # Store all types
-        for key, value in test_data.items():
-            await memory_store.store(key, value)
+        await memory_store.store(key, value)
         
-        # Verify all types
-        for key, expected_value in test_data.items():
-            result = await memory_store.retrieve(key)
-            assert result == expected_value
-            assert type(result) == type(expected_value)
+        result = await memory_store.retrieve(key)
+        assert result == value
+        assert type(result) == type(value)
+
+    def test_memory_store_is_slotted(self, memory_store: MemoryStore):
+        """
+        Test that MemoryStore instances carry no per-instance __dict__.
+        Verifies:
+        - The slots declared on MemoryStore take effect
+        """
+        assert not hasattr(memory_store, "__dict__")
 
 class TestDataStoreInterface:
     """
@@ -124,25 +122,14 @@ class TestDataStoreInterface:
     These tests ensure any DataStore implementation follows the contract.
     """
     
-    class MinimalDataStore(DataStore):
-        """Minimal implementation of DataStore for testing."""
-        async def store(self, key: str, data: Dict[str, Any]) -> None:
-            pass
-            
-        async def retrieve(self, key: str) -> Dict[str, Any]:
-            return {}
-            
-        async def delete(self, key: str) -> None:
-            pass
-
-    def test_interface_implementation(self):
+    def test_interface_implementation(self, minimal_store):
         """
         Test that implementing DataStore interface is possible.
         Verifies:
         - Interface can be implemented
         - Required methods are present
         """
-        store = self.MinimalDataStore()
+        store = minimal_store
         assert isinstance(store, DataStore)
         
         # Verify required methods exist
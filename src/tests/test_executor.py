@@ -1,7 +1,44 @@
 import pytest
 import asyncio
+from src.agents import BaseAgent
 from src.agents.executor import ExecutionStatus
 
+class _ContextWritingGraph:
+    """Stand-in workflow that records a visit in the state's context."""
+    async def arun(self, state):
+        state.context["visited"] = True
+        return state
+
+class ContextWritingAgent(BaseAgent):
+    """Agent that runs the base execute over a workflow writing to its context."""
+    def _create_state_graph(self):
+        return _ContextWritingGraph()
+    
+    async def process(self, state):
+        return state, "end"
+
+class FailingAgent(BaseAgent):
+    """Agent whose execution always raises."""
+    def _create_state_graph(self):
+        return None
+    
+    async def process(self, state):
+        return state, "end"
+    
+    async def execute(self, initial_input=None, context=None):
+        raise RuntimeError("agent failure")
+
+class SlowAgent(BaseAgent):
+    """Agent that takes far longer than the timeouts used in tests."""
+    def _create_state_graph(self):
+        return None
+    
+    async def process(self, state):
+        return state, "end"
+    
+    async def execute(self, initial_input=None, context=None):
+        await asyncio.sleep(10)
+
 @pytest.mark.asyncio
 async def test_resource_cleanup(
     executor,
@@ -140,4 +177,92 @@ async def test_context_isolation(
         executor.execute_agent("test_agent", "query", context2)
     )
     
-    assert all(r.status == ExecutionStatus.COMPLETED for r in results) 
\ No newline at end of file
+    assert all(r.status == ExecutionStatus.COMPLETED for r in results) 
+
+@pytest.mark.asyncio
+async def test_shared_context_is_copied(
+    executor,
+    agent_registry
+):
+    """Test that agents given the same context dict each work on their own copy."""
+    agent_registry.register("context_agent")(ContextWritingAgent)
+    context = {"user_id": "test_user"}
+    
+    results = await executor.execute_parallel(
+        ["context_agent", "context_agent"],
+        query="test query",
+        context=context
+    )
+    
+    assert all(r.status == ExecutionStatus.COMPLETED for r in results)
+    first, second = (r.state.context for r in results)
+    assert first is not second
+    assert first["visited"] and second["visited"]
+    assert context == {"user_id": "test_user"}
+
+@pytest.mark.asyncio
+async def test_timeout_results_do_not_share_state(
+    executor,
+    agent_registry
+):
+    """Test that every timed-out execution gets its own state."""
+    agent_registry.register("slow_agent")(SlowAgent)
+    
+    first, second = await asyncio.gather(
+        executor.execute_agent("slow_agent", "query", timeout=0.01),
+        executor.execute_agent("slow_agent", "query", timeout=0.01)
+    )
+    
+    assert first.status == second.status == ExecutionStatus.FAILED
+    assert isinstance(first.error, TimeoutError)
+    assert first.state is not second.state
+    first.state.context["user_id"] = "test_user"
+    first.state.status = "running"
+    assert second.state.context == {}
+    assert second.state.status == "timeout"
+
+@pytest.mark.asyncio
+async def test_agent_failure_is_reported(
+    executor,
+    agent_registry
+):
+    """Test that an agent raising during execution yields a failed result."""
+    agent_registry.register("failing_agent")(FailingAgent)
+    
+    result = await executor.execute_agent("failing_agent", "query")
+    
+    assert result.status == ExecutionStatus.FAILED
+    assert not result.success
+    assert isinstance(result.error, RuntimeError)
+    assert result.state.error == "agent failure"
+    assert len(executor._execution_tasks) == 0
+
+@pytest.mark.asyncio
+async def test_cancel_while_queued_passes_on_wake_up(
+    executor,
+    register_mock_agents
+):
+    """
+    Test that a queued execution cancelled right after being woken passes the wake-up on.
+    Verifies:
+    - The next queued execution is admitted and completes
+    - No concurrency slot is leaked
+    """
+    await executor.set_max_concurrency(1)
+    # Hold the only slot, as a running execution would
+    executor._running = 1
+    second = asyncio.create_task(executor._execute_bounded("test_agent", "query"))
+    third = asyncio.create_task(executor._execute_bounded("test_agent", "query"))
+    await asyncio.sleep(0)
+    
+    # Release the slot as _execute_bounded does, then cancel the woken waiter
+    # before it gets to run, e.g. from a group timeout
+    executor._running -= 1
+    async with executor._admission:
+        executor._admission.notify(1)
+    second.cancel()
+    
+    result = await asyncio.wait_for(third, timeout=1)
+    assert result.status == ExecutionStatus.COMPLETED
+    assert second.cancelled()
+    assert executor._running == 0
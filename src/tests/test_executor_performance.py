@@ -44,22 +44,27 @@ async def test_memory_usage(
     mock_context
 ):
     """Test memory usage during large parallel executions."""
-    import psutil
-    import os
+    import tracemalloc
     
-    process = psutil.Process(os.getpid())
-    initial_memory = process.memory_info().rss
-    
-    # Execute large number of agents
-    results = await executor.execute_parallel(
-        ["test_agent"] * 500,
-        query="test query",
-        context=mock_context
+    # Count only allocations made by this run, not the whole interpreter's RSS
+    tracemalloc.start()
+    try:
+        initial_snapshot = tracemalloc.take_snapshot()
+        
+        # Execute large number of agents
+        results = await executor.execute_parallel(
+            ["test_agent"] * 500,
+            query="test query",
+            context=mock_context
+        )
+        
+        final_snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    memory_increase = sum(
+        stat.size_diff for stat in final_snapshot.compare_to(initial_snapshot, "filename")
     )
     
-    final_memory = process.memory_info().rss
-    memory_increase = final_memory - initial_memory
-    
     # Check memory usage
     assert len(results) == 500
     assert memory_increase < 100 * 1024 * 1024  # Less than 100MB increase
@@ -113,11 +118,13 @@ async def test_resource_usage_under_load(
     mock_context
 ):
     """Test resource usage under heavy load conditions."""
-    import psutil
-    import os
+    resource = pytest.importorskip("resource")  # Unix only
+    
+    def cpu_seconds() -> float:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime
     
-    process = psutil.Process(os.getpid())
-    initial_cpu_percent = process.cpu_percent()
+    initial_cpu = cpu_seconds()
     
     # Create heavy load
     tasks = []
@@ -134,14 +141,13 @@ async def test_resource_usage_under_load(
     # Wait for all tasks
     results = await asyncio.gather(*tasks)
     
-    final_cpu_percent = process.cpu_percent()
-    cpu_increase = final_cpu_percent - initial_cpu_percent
+    cpu_used = cpu_seconds() - initial_cpu
     
     # Verify results
     assert len(results) == 5
     assert all(len(batch) == 100 for batch in results)
     
     # Check resource usage
-    assert cpu_increase < 90  # CPU usage shouldn't max out
+    assert cpu_used < 5  # 500 executions shouldn't take more than a few CPU-seconds
     assert len(executor._active_agents) == 0
     assert len(executor._execution_tasks) == 0 
\ No newline at end of file
@@ -1,5 +1,4 @@
 import pytest
-from datetime import datetime, timezone
 from typing import Dict, Any
 from src.utils.academic_states import (
     AcademicState,
@@ -8,27 +7,16 @@ from src.utils.academic_states import (
     AcademicTask
 )
 from src.data.manager import DataManager, MemoryStore
-
-@pytest.fixture
-async def memory_store():
-    """Create a memory store instance for testing."""
-    store = MemoryStore()
-    return store
-
-@pytest.fixture
-async def data_manager(memory_store):
-    """Create a data manager instance for testing."""
-    store = await memory_store
-    return DataManager(store=store)
+from src.tests.conftest import NOW
 
 @pytest.fixture
 def sample_student_data() -> Dict[str, Any]:
     """Create sample student data for testing."""
-    now = datetime.now(timezone.utc)
     return {
         "profile": {
             "id": "student123",
             "name": "Test Student",
+            "type": "student",
             "level": "undergraduate",
             "courses": ["CS101", "MATH201"],
             "topics": ["Python", "Data Structures"],
@@ -41,8 +29,8 @@ def sample_student_data() -> Dict[str, Any]:
                     "id": "evt123",
                     "title": "CS101 Lecture",
                     "type": "class",
-                    "start_time": now,
-                    "end_time": now,
+                    "start_time": NOW,
+                    "end_time": NOW,
                     "description": "Introduction to Programming",
                     "metadata": {}
                 }
@@ -54,7 +42,7 @@ def sample_student_data() -> Dict[str, Any]:
                     "id": "task123",
                     "title": "Assignment 1",
                     "description": "Complete programming exercise",
-                    "due_date": now,
+                    "due_date": NOW,
                     "status": "pending",
                     "priority": 1,
                     "attachments": [],
@@ -85,23 +73,21 @@ class TestSystemIntegration:
         assert success is True
 
         # Retrieve and verify state
-        profile = await data_manager.get_profile(student_id)
-        calendar = await data_manager.get_calendar(student_id)
-        tasks = await data_manager.get_tasks(student_id)
+        profile, calendar, tasks = await data_manager.get_bundle(student_id)
 
         assert profile is not None
-        assert profile.name == "Test Student"
-        assert profile.level == "undergraduate"
-        assert len(profile.courses) == 2
-        assert "CS101" in profile.courses
+        assert profile["name"] == "Test Student"
+        assert profile["level"] == "undergraduate"
+        assert len(profile["courses"]) == 2
+        assert "CS101" in profile["courses"]
 
         assert len(calendar) == 1
-        assert calendar[0].title == "CS101 Lecture"
-        assert calendar[0].type == "class"
+        assert calendar[0]["title"] == "CS101 Lecture"
+        assert calendar[0]["type"] == "class"
 
         assert len(tasks) == 1
-        assert tasks[0].title == "Assignment 1"
-        assert tasks[0].status == "pending"
+        assert tasks[0]["title"] == "Assignment 1"
+        assert tasks[0]["status"] == "pending"
 
     @pytest.mark.asyncio
     async def test_concurrent_updates(
@@ -135,8 +121,8 @@ class TestSystemIntegration:
         # Verify updates
         final_profile = await data_manager.get_profile(student_id)
         assert final_profile is not None
-        assert "CS102" in final_profile.courses
-        assert len(final_profile.courses) == 3
+        assert "CS102" in final_profile["courses"]
+        assert len(final_profile["courses"]) == 3
 
     @pytest.mark.asyncio
     async def test_error_handling(
@@ -169,4 +155,4 @@ class TestSystemIntegration:
         # Verify original state preserved
         profile = await data_manager.get_profile(student_id)
         assert profile is not None
-        assert profile.id == student_id  # Original data should be preserved 
\ No newline at end of file
+        assert profile["id"] == student_id  # Original data should be preserved 
\ No newline at end of file
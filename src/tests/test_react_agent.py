@@ -0,0 +1,242 @@
+import pytest
+import asyncio
+from types import SimpleNamespace
+from datetime import datetime, timezone, timedelta
+from src.agents.react import ReActAgent, Tool, ToolBatcher
+
+@pytest.fixture
+def react_agent():
+    """Create a ReActAgent without a language model."""
+    return ReActAgent(llm=None)
+
+@pytest.fixture
+def calendar_state():
+    """Create a minimal state with one past and one future event."""
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        calendar={
+            "past": {"id": "past", "title": "Old Lecture", "start_time": now - timedelta(days=1)},
+            "future": {"id": "future", "title": "Exam", "start_time": (now + timedelta(days=1)).isoformat()}
+        }
+    )
+
+@pytest.mark.asyncio
+async def test_search_calendar_filters_future_events(react_agent, calendar_state):
+    """
+    Test search_calendar returns only upcoming events.
+    Verifies:
+    - Past events are filtered out
+    - ISO string start times are parsed and compared
+    """
+    events = await react_agent.search_calendar(calendar_state)
+    assert [event["id"] for event in events] == ["future"]
+
+@pytest.mark.asyncio
+async def test_run_tools_preserves_action_order(react_agent, calendar_state):
+    """
+    Test run_tools executes several tools and keeps result order.
+    Verifies:
+    - Results are returned in the order actions were given
+    - Unknown tools raise ValueError
+    """
+    calendar_state.tasks = {"task1": {"id": "task1"}}
+    events, tasks = await react_agent.run_tools(
+        [("search_calendar", {}), ("analyze_tasks", {})],
+        calendar_state
+    )
+    assert [event["id"] for event in events] == ["future"]
+    assert tasks == [{"id": "task1"}]
+
+    with pytest.raises(ValueError):
+        await react_agent.run_tools([("missing_tool", {})], calendar_state)
+
+def test_tool_table_matches_tool_ids(react_agent):
+    """
+    Test the Tool ids index the matching tools.
+    Verifies:
+    - Every Tool id resolves to the same tool as its name
+    """
+    for tool in Tool:
+        assert react_agent.tool_table[tool] == react_agent.tools[tool.name.lower()]
+
+@pytest.mark.asyncio
+async def test_check_tools_write_results(react_agent):
+    """
+    Test the profile checks record their analysis in state results.
+    Verifies:
+    - Learning style and patterns are read from profile preferences
+    - Missing profile sections fall back to empty values
+    - Performance analysis lists the profile topics
+    """
+    state = SimpleNamespace(
+        profile={"preferences": {"learning_style": {"visual": True}}, "topics": ["Python"]},
+        results={}
+    )
+    await react_agent.check_learning_style(state)
+    await react_agent.check_performance(state)
+
+    assert state.results["learning_style"]["learning_style"] == {"visual": True}
+    assert state.results["learning_style"]["patterns"] == {}
+    assert state.results["performance_analysis"] == {"topics": ["Python"]}
+
+@pytest.mark.asyncio
+async def test_search_calendar_limit_returns_soonest(react_agent):
+    """
+    Test search_calendar with a limit returns the soonest upcoming events.
+    Verifies:
+    - Only `limit` events are returned
+    - Events are ordered by start time
+    """
+    now = datetime.now(timezone.utc)
+    state = SimpleNamespace(calendar={
+        f"evt{days}": {"id": f"evt{days}", "start_time": now + timedelta(days=days)}
+        for days in (5, 1, 3, -2)
+    })
+    events = await react_agent.search_calendar(state, limit=2)
+    assert [event["id"] for event in events] == ["evt1", "evt3"]
+
+@pytest.mark.asyncio
+async def test_search_calendar_limit_zero_and_negative(react_agent, calendar_state):
+    """
+    Test search_calendar with a zero or negative limit.
+    Verifies:
+    - A limit of zero returns no events
+    - A negative limit raises ValueError
+    """
+    assert await react_agent.search_calendar(calendar_state, limit=0) == []
+    with pytest.raises(ValueError):
+        await react_agent.search_calendar(calendar_state, limit=-1)
+
+@pytest.mark.asyncio
+async def test_run_tools_return_exceptions(react_agent):
+    """
+    Test run_tools can report tool failures in place.
+    Verifies:
+    - A failing tool's exception is returned in its slot
+    - Other tools still return their results
+    """
+    state = SimpleNamespace(tasks={"task1": {"id": "task1"}})  # no calendar, so search fails
+    calendar_result, tasks = await react_agent.run_tools(
+        [("search_calendar", {}), ("analyze_tasks", {})],
+        state,
+        return_exceptions=True
+    )
+    assert isinstance(calendar_result, AttributeError)
+    assert tasks == [{"id": "task1"}]
+
+@pytest.mark.asyncio
+async def test_search_calendar_reuses_index(react_agent, calendar_state):
+    """
+    Test the sorted calendar index is reused and refreshed.
+    Verifies:
+    - Searching the same calendar twice reuses the index
+    - Adding an event rebuilds the index
+    """
+    await react_agent.search_calendar(calendar_state)
+    index = react_agent._calendar_index
+    await react_agent.search_calendar(calendar_state)
+    assert react_agent._calendar_index is index
+
+    calendar_state.calendar["later"] = {
+        "id": "later",
+        "start_time": datetime.now(timezone.utc) + timedelta(days=7)
+    }
+    events = await react_agent.search_calendar(calendar_state)
+    assert [event["id"] for event in events] == ["future", "later"]
+
+@pytest.mark.asyncio
+async def test_search_calendar_sees_in_place_updates(react_agent, calendar_state):
+    """
+    Test the calendar index follows events edited in place.
+    Verifies:
+    - Rescheduling an event into the past drops it from the results
+    - Replacing an event under the same key is picked up
+    """
+    now = datetime.now(timezone.utc)
+    await react_agent.search_calendar(calendar_state)
+
+    calendar_state.calendar["future"]["start_time"] = now - timedelta(hours=1)
+    assert await react_agent.search_calendar(calendar_state) == []
+
+    calendar_state.calendar["past"] = {"id": "past", "title": "Moved Lecture", "start_time": now + timedelta(days=2)}
+    events = await react_agent.search_calendar(calendar_state)
+    assert [event["title"] for event in events] == ["Moved Lecture"]
+
+@pytest.mark.asyncio
+async def test_tool_batcher_dispatches_concurrent_calls(react_agent, calendar_state):
+    """
+    Test ToolBatcher runs buffered calls and routes each result back.
+    Verifies:
+    - Concurrent submissions each get their own tool result
+    - Tool failures reach only the caller that submitted them
+    """
+    calendar_state.tasks = {"task1": {"id": "task1"}}
+    batcher = ToolBatcher(react_agent, max_batch=2)
+    try:
+        events, tasks, failure = await asyncio.gather(
+            batcher.submit("search_calendar", calendar_state),
+            batcher.submit("analyze_tasks", calendar_state),
+            batcher.submit("analyze_tasks", SimpleNamespace()),
+            return_exceptions=True
+        )
+    finally:
+        await batcher.stop()
+
+    assert [event["id"] for event in events] == ["future"]
+    assert tasks == [{"id": "task1"}]
+    assert isinstance(failure, AttributeError)
+
+@pytest.mark.asyncio
+async def test_tool_batcher_stop_cancels_in_flight_calls(react_agent, calendar_state):
+    """
+    Test stopping a ToolBatcher while a batch is still running.
+    Verifies:
+    - Callers waiting on the in-flight batch are cancelled instead of hanging
+    """
+    started = asyncio.Event()
+
+    async def slow_tool(state):
+        started.set()
+        await asyncio.sleep(10)
+
+    react_agent.tools = {"slow_tool": slow_tool}
+    batcher = ToolBatcher(react_agent, max_delay=0)
+    call = asyncio.create_task(batcher.submit("slow_tool", calendar_state))
+    await asyncio.wait_for(started.wait(), timeout=1)
+
+    await batcher.stop()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(call, timeout=1)
+
+@pytest.mark.asyncio
+async def test_tool_batcher_bad_arguments_fail_only_their_call(react_agent, calendar_state):
+    """
+    Test a call that raises before it starts, e.g. with bad arguments.
+    Verifies:
+    - The caller with bad arguments gets the TypeError
+    - Other calls in the same batch still get their results
+    - The batcher keeps working and stops cleanly
+    """
+    calendar_state.tasks = {"task1": {"id": "task1"}}
+    batcher = ToolBatcher(react_agent, max_batch=2)
+    try:
+        failure, tasks = await asyncio.wait_for(asyncio.gather(
+            batcher.submit("analyze_tasks", calendar_state, bogus=1),
+            batcher.submit("analyze_tasks", calendar_state),
+            return_exceptions=True
+        ), timeout=1)
+        later = await asyncio.wait_for(batcher.submit("analyze_tasks", calendar_state), timeout=1)
+    finally:
+        await batcher.stop()
+
+    assert isinstance(failure, TypeError)
+    assert tasks == later == [{"id": "task1"}]
+
+def test_tools_mapping_is_read_only(react_agent):
+    """
+    Test the name to tool mapping is read-only.
+    Verifies:
+    - Assigning a tool raises TypeError
+    """
+    with pytest.raises(TypeError):
+        react_agent.tools["search_calendar"] = None
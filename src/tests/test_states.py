@@ -13,6 +13,7 @@ from src.utils.reducers import (
     AgentState,
     InteractionState
 )
+from src.tests.conftest import NOW
 
 def test_dict_reducer():
     """Test dictionary merging functionality."""
@@ -66,8 +67,8 @@ def test_calendar_event():
         "event_id": "evt_1",
         "title": "CS101 Lecture",
         "event_type": "class",
-        "start_time": datetime.now(),
-        "end_time": datetime.now(),
+        "start_time": NOW,
+        "end_time": NOW,
         "course_id": "CS101",
         "location": "Room 101"
     }
@@ -83,7 +84,7 @@ def test_academic_task():
         "title": "Programming Assignment",
         "task_type": "assignment",
         "course_id": "CS101",
-        "due_date": datetime.now(),
+        "due_date": NOW,
         "priority": 1,
         "status": "pending",
         "requirements": ["Python", "Git"],
@@ -100,7 +101,7 @@ def test_study_session():
         "session_id": "sess_1",
         "topic": "Python Basics",
         "course_id": "CS101",
-        "start_time": datetime.now(),
+        "start_time": NOW,
         "duration": 60.0,
         "objectives": ["Learn variables", "Learn functions"],
         "materials": ["textbook", "slides"],
@@ -174,10 +175,10 @@ def test_interaction_state():
     """Test interaction state."""
     interaction: InteractionState = {
         "session_id": "int_1",
-        "start_time": datetime.now(),
+        "start_time": NOW,
         "interaction_type": "tutoring",
         "context": {"topic": "Python"},
-        "history": [{"action": "question", "time": datetime.now()}],
+        "history": [{"action": "question", "time": NOW}],
         "objectives": ["Learn Python basics"],
         "progress": {"completed_topics": 1},
         "current_focus": "variables"
@@ -104,8 +104,9 @@ class AcademicState(AgentState):
         # First merge base state
         base_merged = super().merge(other)
         
-        # Then merge academic-specific state
-        merged_state = AcademicState(
+        # Then merge academic-specific state. Both inputs are already validated and
+        # every reducer returns fresh containers, so skip re-validating the result
+        merged_state = AcademicState.construct_trusted(
             # Base state components from parent
             **base_merged,
             
@@ -121,8 +122,35 @@ class AcademicState(AgentState):
             study_plans=dict_reducer(self.study_plans, other.study_plans),
             results=dict_reducer(self.results, other.results),
             feedback=list_append_reducer(self.feedback, other.feedback),
-            validation=dict_reducer(self.validation.model_dump(), other.validation.model_dump()),
+            validation=self.validation.merge(other.validation),
             notifications=list_append_reducer(self.notifications, other.notifications)
         )
         
-        return merged_state 
\ No newline at end of file
+        return merged_state
+
+    def merge_inplace(self, other: 'AcademicState') -> 'AcademicState':
+        """
+        Merge another academic state into this one.
+        The append-only logs (upcoming events, completed tasks, feedback and
+        notifications) are extended in place rather than copied, so accumulating
+        many states stays linear; the remaining fields go through their reducers.
+        The context is never written in place (see AgentState.merge_inplace).
+        """
+        super().merge_inplace(other)
+        
+        self.upcoming_events.extend(other.upcoming_events)
+        self.completed_tasks.extend(other.completed_tasks)
+        self.feedback.extend(other.feedback)
+        self.notifications.extend(other.notifications)
+        
+        # Nested dicts may be shared with other states, so these are never updated in place
+        self.profile = dict_reducer(self.profile, other.profile)
+        self.calendar = dict_reducer(self.calendar, other.calendar)
+        self.tasks = dict_reducer(self.tasks, other.tasks)
+        self.active_tasks = list_unique_reducer(self.active_tasks, other.active_tasks)
+        self.progress = dict_reducer(self.progress, other.progress)
+        self.learning_resources = dict_reducer(self.learning_resources, other.learning_resources)
+        self.study_plans = dict_reducer(self.study_plans, other.study_plans)
+        self.results = dict_reducer(self.results, other.results)
+        self.validation = self.validation.merge(other.validation)
+        return self 
\ No newline at end of file
@@ -1,4 +1,5 @@
 from typing import TypeVar, Dict, Any, List
+from itertools import chain
 from typing_extensions import Annotated
 
 T = TypeVar('T')
@@ -12,12 +13,33 @@ def dict_reducer(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]
     dict2 = {"a": {"y": 2}, "c": 3}
     result = {"a": {"x": 1, "y": 2}, "b": 2, "c": 3}
     """
+    # Nothing to merge into one side, so a single C-level copy suffices
+    if not dict1:
+        return dict2.copy()
+    if not dict2:
+        return dict1.copy()
+    # Merging a dict with itself changes nothing, e.g. for a field shared with a
+    # shallow copy of the same state
+    if dict1 is dict2:
+        return dict1.copy()
+    
     merged = dict1.copy()
-    for key, value in dict2.items():
-        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-            merged[key] = dict_reducer(merged[key], value)
-        else:
-            merged[key] = value
+    # Nested dicts are merged from an explicit stack rather than by recursion,
+    # so deep nesting doesn't cost a Python call per level
+    pending = [(merged, dict2)]
+    while pending:
+        target, source = pending.pop()
+        get = target.get
+        for key, value in source.items():
+            # Plain dicts are the common case; the exact type check skips the MRO walk
+            if type(value) is dict or isinstance(value, dict):
+                existing = get(key)
+                if type(existing) is dict or isinstance(existing, dict):
+                    # Copy only the sub-dicts on a merged path; the rest stay shared
+                    target[key] = existing = existing.copy()
+                    pending.append((existing, value))
+                    continue
+            target[key] = value
     return merged
 
 def list_append_reducer(list1: List[T], list2: List[T]) -> List[T]:
@@ -40,7 +62,7 @@ def list_append_reducer(list1: List[T], list2: List[T]) -> List[T]:
 def list_unique_reducer(list1: List[T], list2: List[T]) -> List[T]:
     """
     Merge two lists maintaining uniqueness.
-    Used for sets of unique items.
+    Used for sets of unique items. Keeps the first occurrence of each item in order.
     
     Example:
     list1 = ["python", "java"]
@@ -52,4 +74,4 @@ def list_unique_reducer(list1: List[T], list2: List[T]) -> List[T]:
     - Requirements
     - Resource identifiers
     """
-    return list(set(list1 + list2))
+    return list(dict.fromkeys(chain(list1, list2)))